@@ -1,30 +1,96 @@
-from pyparsing import Word, alphas, alphanums, oneOf, infixNotation, opAssoc
+from functools import lru_cache
+from pyparsing import Word, alphas, alphanums, infixNotation, opAssoc
 
 def evaluate_boolean_expression(expression, variables):
+    # Parse once per distinct expression and evaluate the compiled form.
+    return compile_boolean_expression(expression)(variables)
+
+@lru_cache(maxsize=512)
+def compile_boolean_expression(expression):
+    """
+    Parses a boolean expression into a function of a variables dict.
+    Variables are looked up when the function is called, so a compiled
+    expression can be evaluated against many dicts. Every variable named in
+    the expression must be present, even if short-circuiting would not
+    need it, so a missing variable always raises KeyError.
+    """
+    root = _grammar().parseString(expression)[0]
+    names = root.names
+    def evaluate(variables):
+        for name in names:
+            if name not in variables:
+                raise KeyError(name)
+        return root(variables)
+    return evaluate
+
+# Each compiled node carries a `cost`, the number of variable lookups it makes
+# in the worst case. Operands of && and || are evaluated cheapest first so
+# that short-circuiting skips the larger subexpressions. The reordering only
+# affects speed: all variables are known to be present, and && and || return
+# a bool, so the result does not depend on which operand decided it.
+
+def _variable(name):
+    def evaluate(variables):
+        return variables[name]
+    evaluate.cost = 1
+    evaluate.names = (name,)
+    return evaluate
+
+def _not(operand):
+    def evaluate(variables):
+        return not operand(variables)
+    evaluate.cost = operand.cost
+    evaluate.names = operand.names
+    return evaluate
+
+def _and(operands):
+    operands = sorted(operands, key=lambda operand: operand.cost)
+    def evaluate(variables):
+        for operand in operands:
+            if not operand(variables):
+                return False
+        return True
+    evaluate.cost = sum(operand.cost for operand in operands)
+    evaluate.names = _names(operands)
+    return evaluate
+
+def _or(operands):
+    operands = sorted(operands, key=lambda operand: operand.cost)
+    def evaluate(variables):
+        for operand in operands:
+            if operand(variables):
+                return True
+        return False
+    evaluate.cost = sum(operand.cost for operand in operands)
+    evaluate.names = _names(operands)
+    return evaluate
+
+def _names(operands):
+    # Variable names referenced by the operands, in order of first use.
+    return tuple(dict.fromkeys(name for operand in operands for name in operand.names))
+
+@lru_cache(maxsize=None)
+def _grammar():
     # Define grammar
     initial_chars = alphas + "_"
     body_chars = alphanums + "_-"
     variable = Word(initial_chars, body_chars)  # Matches variable names like A, B, _, A1, A-1, etc.
-
-    # variable = Word(alphas)  # Matches variable names like A, B, etc.
-    operand = variable.setParseAction(lambda t: variables[t[0]])  # Replace variable with its boolean value
+    operand = variable.setParseAction(lambda t: _variable(t[0]))
 
     # Define operators
     AND = "&&"
     OR = "||"
     NOT = "!"
-    boolean_expr = infixNotation(
+    # Binary operator groups look like [a, op, b, op, c, ...].
+    return infixNotation(
         operand,
         [
-            (NOT, 1, opAssoc.RIGHT, lambda t: not t[0][1]),
-            (AND, 2, opAssoc.LEFT, lambda t: t[0][0] and t[0][2]),
-            (OR, 2, opAssoc.LEFT, lambda t: t[0][0] or t[0][2]),
+            (NOT, 1, opAssoc.RIGHT, lambda t: _not(t[0][1])),
+            (AND, 2, opAssoc.LEFT, lambda t: _and(t[0][0::2])),
+            (OR, 2, opAssoc.LEFT, lambda t: _or(t[0][0::2])),
         ],
     )
 
-    # Parse and evaluate the expression
-    return boolean_expr.parseString(expression)[0]
-
 # # Example usage
 # if __name__ == "__main__":
 #     variables = {
@@ -7,11 +7,14 @@ from .make_console import MakeConsole
 from gotaglio.pipeline_spec import PipelineSpec, PipelineSpecs
 from .summarize import summarize
 
+# Status cells and their sort order, shared by every row. rich does not
+# modify Text objects when rendering them.
+_STATUS_PASSED = (Text("passed", style="bold green"), 0)
+_STATUS_FAILED = (Text("failed", style="bold red"), 1)
+_STATUS_ERROR = (Text("error", style="bold red"), 2)
 
-def compare(pipeline_specs: PipelineSpecs, a: dict[str, Any], b: dict[str, Any]):
-    console_buffer = MakeConsole()
-    console = console_buffer("text/plain")
 
+def compare(pipeline_specs: PipelineSpecs, a: dict[str, Any], b: dict[str, Any]):
     pipeline_name = a["metadata"]["pipeline"]["name"]
     pipeline_spec = pipeline_specs.get(pipeline_name)
 
@@ -20,6 +23,9 @@ def compare(pipeline_specs: PipelineSpecs, a: dict[str, Any], b: dict[str, Any])
         summarize(pipeline_spec, a)
         return
 
+    console_buffer = MakeConsole()
+    console = console_buffer("text/plain")
+
     if a["metadata"]["pipeline"]["name"] != b["metadata"]["pipeline"]["name"]:
         console.print(
             f"Cannot perform comparison because pipeline names are different: A is '{
@@ -28,6 +34,7 @@ def compare(pipeline_specs: PipelineSpecs, a: dict[str, Any], b: dict[str, Any])
                 b['metadata']['pipeline']['name']
             }'"
         )
+        console_buffer.render()
         return
 
     a_cases = {result["case"]["uuid"]: result for result in a["results"]}
@@ -99,8 +106,8 @@ def compare(pipeline_specs: PipelineSpecs, a: dict[str, Any], b: dict[str, Any])
 def format_status(pipeline_spec: PipelineSpec, result: dict[str, Any]):
     if result["succeeded"]:
         if pipeline_spec.passed_predicate(result):
-            return (Text("passed", style="bold green"), 0)
+            return _STATUS_PASSED
         else:
-            return (Text("failed", style="bold red"), 1)
+            return _STATUS_FAILED
     else:
-        return (Text("error", style="bold red"), 2)
+        return _STATUS_ERROR
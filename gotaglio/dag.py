@@ -1,6 +1,5 @@
 import asyncio
 from datetime import datetime, timedelta, timezone
-from glom import glom
 import traceback
 from typing import Any, List
 import time
@@ -65,6 +64,11 @@ class Dag:
 
         self.dag = dag
 
+        # The DAG is run once per case (or turn), so precompute the nodes
+        # that are ready to run at the start and the inputs of the rest.
+        self.roots = roots
+        self.dependent_inputs = {k: v["inputs"] for k, v in dag.items() if v["inputs"]}
+
 
 def check_for_cycles(dag, node, path):
     if dag[node]["visited"]:
@@ -129,7 +133,7 @@ def make_task(dag, name, context, stage_timing):
 
 
 async def run_dag(dag_object, context: dict[str, Any], turn_index: int | None = None):
-    turns = glom(context, "case.turns", default=None)
+    turns = context.get("case", {}).get("turns")
     if turns is None:
         # Single-turn run: initialize top-level metadata and timing container
         stages: dict[str, Any] = {}
@@ -198,11 +202,10 @@ async def run_dag_helper(dag_object, context, stages, stage_timing):
 
     # DESIGN NOTE: the dict of unfulfilled dependencies is stored per-run,
     # instead of in the DAG to allow for multiple concurrent runs of the same
-    # DAG with different contexts.
-    dependencies = {k: set(v["inputs"]) for k, v in dag.items()}
-
-    ready = [k for k in dag.keys() if not dependencies[k]]
-    waiting = [k for k in dag.keys() if dependencies[k]]
+    # DAG with different contexts. Nodes are removed from it as they become
+    # ready to run.
+    dependencies = {k: set(v) for k, v in dag_object.dependent_inputs.items()}
+    ready = dag_object.roots
 
     if len(ready) == 0:
         raise ValueError(
@@ -233,10 +236,11 @@ async def run_dag_helper(dag_object, context, stages, stage_timing):
             # Propagate the outputs to subsequent stages.
             node = dag[name]
             for output in node["outputs"]:
-                dependencies[output].remove(name)
-                if not dependencies[output]:
-                    waiting.remove(output)
+                inputs = dependencies[output]
+                inputs.remove(name)
+                if not inputs:
+                    del dependencies[output]
                     tasks.add(make_task(dag, output, context, stage_timing))
 
-    if waiting:
+    if dependencies:
         raise ValueError("Internal error: some nodes are still waiting to run")
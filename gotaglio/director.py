@@ -6,12 +6,13 @@ from typing import Any, Callable
 import uuid
 
 from .constants import AUDIO_INPUT_MODEL_TYPES
-from .git_ops import get_current_edits, get_git_sha
+from .git_ops import get_git_info
 from .helpers import IdShortener
 from .models import register_models
 from .pipeline import Pipeline, process_one_case
 from .pipeline_spec import PipelineSpec
 from .registry import Registry
+from .shared import get_path
 
 
 class Director:
@@ -47,8 +48,7 @@ class Director:
             },
         }
 
-        sha = get_git_sha()
-        edits = get_current_edits() if sha else None
+        sha, edits = get_git_info()
         if sha:
             self._metadata["sha"] = sha
         if edits:
@@ -70,14 +70,19 @@ class Director:
             #
             # Perform the run
             #
-            semaphore = asyncio.Semaphore(self._concurrency)
+            # A fixed pool of workers takes cases from a shared iterator, so
+            # only `concurrency` tasks exist at a time, no matter how many
+            # cases there are. Results are stored by index to keep the order
+            # of the cases.
+            results = [None] * len(cases)
+            pending = enumerate(cases)
 
-            async def sem_task(case):
-                async with semaphore:
-                    return await self.process_one_case(case, completed)
+            async def worker():
+                for index, case in pending:
+                    results[index] = await self.process_one_case(case, completed)
 
-            tasks = [sem_task(case) for case in cases]
-            results = await asyncio.gather(*tasks)
+            worker_count = min(self._concurrency, len(cases))
+            await asyncio.gather(*[worker() for _ in range(worker_count)])
 
             #
             # Gather and record post-run metadata
@@ -120,9 +125,7 @@ class Director:
         try:
             # Determine configured model name and type
             config = self._pipeline.get_config()
-            from glom import glom
-
-            model_name = glom(config, "infer.model.name", default=None)
+            model_name = get_path(config, ["infer", "model", "name"])
             if not model_name:
                 # If no model configured, let existing validation/error paths handle it.
                 return
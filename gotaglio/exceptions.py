@@ -1,42 +1,56 @@
+from contextvars import ContextVar
 import traceback
 
 
-class ExceptionContext:
-    # Class-level static context stack
-    context_stack = []
+# The context stack is an immutable tuple held in a ContextVar, so each
+# asyncio task sees its own stack instead of sharing one across cases.
+_context_stack: ContextVar[tuple[str, ...]] = ContextVar(
+    "gotaglio_exception_context", default=()
+)
+
+# Attribute on an exception holding the context stack at the point it was
+# raised.
+_CONTEXT_ATTR = "_gotaglio_context"
 
+
+class ExceptionContext:
     def __init__(self, msg):
         self.msg = msg
 
     def __enter__(self):
         """Add the context when entering the block."""
-        ExceptionContext.context_stack.append(self.msg)
+        self._token = _context_stack.set(_context_stack.get() + (self.msg,))
 
     def __exit__(self, exc_type, exc_value, traceback):
         """
         Remove the context only if no exception occurred.
-        If an exception occurs, leave the context on the stack.
+        If an exception occurs, leave the context on the stack and record it
+        on the exception. The stack belongs to the current task, so a caller
+        in another task, e.g. the one awaiting a DAG stage, would not see it.
         """
         if exc_type is None:
             # No exception occurred, clean up context
-            ExceptionContext.context_stack.pop()
-        # If an exception occurred, do not clean up
+            _context_stack.reset(self._token)
+        elif not hasattr(exc_value, _CONTEXT_ATTR):
+            # The innermost block sees the exception first, with the full stack.
+            setattr(exc_value, _CONTEXT_ATTR, _context_stack.get())
         return False  # Do not suppress exceptions
 
     @classmethod
     def get_context(cls):
         """Retrieve the current context stack."""
-        return " > ".join(cls.context_stack)
+        return " > ".join(_context_stack.get())
 
     @classmethod
     def clear_context(cls):
         """Clear the entire context stack."""
-        cls.context_stack.clear()
+        _context_stack.set(())
 
     @classmethod
     def format_message(cls, exception, format_traceback=False):
         """
-        Format an exception message with the current context stack.
+        Format an exception message with the context stack recorded on the
+        exception, or the current context stack if none was recorded.
 
         Args:
             exception (Exception): The exception to format.
@@ -44,7 +58,8 @@ class ExceptionContext:
         Returns:
             str: A formatted string including the exception and context.
         """
-        context = cls.get_context()
+        stack = getattr(exception, _CONTEXT_ATTR, None)
+        context = " > ".join(stack) if stack is not None else cls.get_context()
         context_text = f"Context: {context}\n" if context else ""
         traceback_text = f"{traceback.format_exc()}\n" if format_traceback else ""
         return f"{context_text}Error: {exception}\n{traceback_text}"
@@ -1,5 +1,3 @@
-from glom import glom
-
 from .helpers import IdShortener
 from .make_console import MakeConsole
 from .pipeline import diff_configs
@@ -46,10 +44,15 @@ def format(
             # for each case id.
             short_id = IdShortener([result["case"]["uuid"] for result in results])
 
+            # The uuid_prefix is used to filter out cases that do not match the prefix.
+            if uuid_prefix:
+                results = [
+                    result
+                    for result in results
+                    if result["case"]["uuid"].startswith(uuid_prefix)
+                ]
+
             for result in results:
-                # The uuid_prefix is used to filter out cases that do not match the prefix.
-                if uuid_prefix and not result["case"]["uuid"].startswith(uuid_prefix):
-                    continue
                 turn_count = (
                     f" ({len(result['turns'])} turn{'s' if len(result['turns']) != 1 else ''})"
                     if using_turns
@@ -72,7 +75,7 @@ def format(
                     f"## Case: {short_id(result['case']['uuid'])}{turn_count} - {"PASSED" if passed else "FAILED"}"
                 )
                 console.print(
-                    f"**Keywords:** {', '.join(glom(result, 'case.keywords', default=[]))}  "
+                    f"**Keywords:** {', '.join(result['case'].get('keywords', []))}  "
                 )
                 console.print()
 
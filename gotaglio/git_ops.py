@@ -18,8 +18,25 @@ def get_git_sha(repo_path="."):
         return None
 
 
+def get_git_info(repo_path="."):
+    """
+    Returns the (sha, edits) pair for the repository at `repo_path`, opening
+    it once. Both are None when there is no repository or git is not
+    available.
+    """
+    try:
+        repo = Repo(repo_path)
+        sha = repo.head.commit.hexsha
+    except Exception as e:
+        return None, None
+    return sha, repo_edits(repo)
+
+
 def get_current_edits(repo_path="."):
-    repo = Repo(repo_path)
+    return repo_edits(Repo(repo_path))
+
+
+def repo_edits(repo):
     edits = {"modified": [], "added": [], "deleted": [], "untracked": [], "renamed": []}
 
     # Get modified, added, deleted, and renamed files
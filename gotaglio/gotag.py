@@ -1,7 +1,6 @@
 import asyncio
 import nest_asyncio
 from typing import Any
-import uuid
 
 from .compare import compare
 from .constants import app_configuration_values
@@ -12,6 +11,8 @@ from .shared import (
     apply_patch_in_place,
     read_json_file,
     read_log_file_from_prefix,
+    rerun_inputs,
+    uuid4_strings,
     write_log_file,
 )
 from .summarize import summarize
@@ -33,11 +34,10 @@ class Gotaglio:
 
     def add_ids(self, cases, force=False):
         # TODO: allow either a runlog object or a string id prefix
-        add_count = 0
-        for case in cases:
-            if "uuid" not in case or force:
-                case["uuid"] = str(uuid.uuid4())
-                add_count += 1
+        targets = [case for case in cases if "uuid" not in case or force]
+        for case, id in zip(targets, uuid4_strings(len(targets))):
+            case["uuid"] = id
+        add_count = len(targets)
         print(f"Total cases: {len(cases)}")
         print(f"UUIDs added: {add_count}")
 
@@ -47,25 +47,15 @@ class Gotaglio:
         compare(self._pipeline_specs, runlog_a, runlog_b)
 
     def format(self, runlog_or_prefix, case_uuid_prefix=None):
-        runlog = runlog_from_runlog_or_prefix(runlog_or_prefix)
-        pipeline_name = runlog["metadata"]["pipeline"]["name"]
-        pipeline_spec = self._pipeline_specs.get(pipeline_name)
-
-        format(pipeline_spec, runlog, case_uuid_prefix)
+        self._dispatch(format, runlog_or_prefix, case_uuid_prefix)
 
     def load(self, uuid_prefix):
         return read_log_file_from_prefix(uuid_prefix)
 
     def rerun(self, runlog_or_prefix, flat_config_patch={}, concurrency=2, save=False):
-        runlog = runlog_from_runlog_or_prefix(runlog_or_prefix)
-        cases = [record["case"] for record in runlog["results"]]
-        metadata = runlog["metadata"]
-        if "pipeline" not in metadata:
-            raise Exception("No pipeline metadata found in results file")
-
-        pipeline_name = metadata["pipeline"]["name"]
-        pipeline_spec = self._pipeline_specs.get(pipeline_name)
-        replacement_config = metadata["pipeline"]["config"]
+        pipeline, cases = rerun_inputs(runlog_from_runlog_or_prefix(runlog_or_prefix))
+        pipeline_spec = self._pipeline_specs.get(pipeline["name"])
+        replacement_config = pipeline["config"]
 
         director = Director(
             pipeline_spec,
@@ -115,10 +105,17 @@ class Gotaglio:
         write_log_file(runlog, filename, chatty)
 
     def summarize(self, runlog_or_prefix):
+        self._dispatch(summarize, runlog_or_prefix)
+
+    def _dispatch(self, op, runlog_or_prefix, *args):
+        """
+        Shared scaffolding for the single-runlog reports (format, summarize).
+        Loads the runlog, looks up its pipeline spec, and invokes `op`.
+        """
         runlog = runlog_from_runlog_or_prefix(runlog_or_prefix)
         pipeline_name = runlog["metadata"]["pipeline"]["name"]
         pipeline_spec = self._pipeline_specs.get(pipeline_name)
-        summarize(pipeline_spec, runlog)
+        op(pipeline_spec, runlog, *args)
 
 
 def runlog_from_runlog_or_prefix(runlog_or_prefix):
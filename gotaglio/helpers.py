@@ -19,7 +19,18 @@ def IdShortener(composite_ids):
 
     prefix_len = max(minimal_unique_prefix([x[0] for x in parts]), 3)
 
-    return lambda uuid: shorten(uuid, prefix_len)
+    # The ids have already been parsed, so shorten them all up front rather
+    # than parsing each one again on lookup.
+    short_ids = {
+        id: format_short_id(uuid, n, prefix_len)
+        for id, (uuid, n) in zip(composite_ids, parts)
+    }
+
+    def short_id(uuid):
+        result = short_ids.get(uuid)
+        return result if result is not None else shorten(uuid, prefix_len)
+
+    return short_id
 
 
 def shorten(composite_id, prefix_len):
@@ -31,6 +42,10 @@ def shorten(composite_id, prefix_len):
     if parts is None:
         return None
     uuid, n = parts
+    return format_short_id(uuid, n, prefix_len)
+
+
+def format_short_id(uuid, n, prefix_len):
     return f"{uuid[:prefix_len]}{'.' + str(n) if n is not None else ''}"
 
 
@@ -1,18 +1,9 @@
 import argparse
+import sys
 
 from .constants import app_configuration
 from .exceptions import ExceptionContext
 from .pipeline_spec import PipelineSpec, PipelineSpecs
-from .registry import Registry
-from .subcommands.add_ids_cmd import add_ids
-from .subcommands.compare_cmd import compare_command
-from .subcommands.format_cmd import format_command
-from .subcommands.help_cmd import show_help
-from .subcommands.history_cmd import show_history
-from .subcommands.list_models_cmd import list_models
-from .subcommands.list_pipelines_cmd import list_pipelines
-from .subcommands.run_cmd import rerun_command, run_command
-from .subcommands.summarize_cmd import summarize_command
 
 
 def main(pipelines: list[PipelineSpec]):
@@ -23,7 +14,8 @@ def main(pipelines: list[PipelineSpec]):
     # instantiation exceptions before argument parsing exceptions.
     def create_registry():
         from .models import register_models
-        
+        from .registry import Registry
+
         registry = Registry()
         for pipeline in pipelines:
             registry.register_pipeline(pipeline)
@@ -40,7 +32,82 @@ def main(pipelines: list[PipelineSpec]):
 
     subparsers = parser.add_subparsers(dest="command", help="Subcommands")
 
-    # 'add-ids' subcommand
+    # Only build the subparser for the requested command. Every subparser is
+    # needed for top-level help, for the `help` command, and to report an
+    # unknown command.
+    command = sys.argv[1] if len(sys.argv) > 1 else None
+    if command in subparser_builders and command != "help":
+        subparser_builders[command](subparsers)
+    else:
+        for add_subparser in subparser_builders.values():
+            add_subparser(subparsers)
+
+    # Parse arguments
+    args = parser.parse_args()
+
+    # Route to the appropriate function based on the command. Subcommand
+    # modules are imported only when they are run, so that, for example,
+    # `help` does not load the Director and git.
+    try:
+        if args.command == "add-ids":
+            from .subcommands.add_ids_cmd import add_ids
+
+            add_ids(args.suite, args.force)
+
+        elif args.command == "compare":
+            from .subcommands.compare_cmd import compare_command
+
+            compare_command(pipeline_specs, args)
+
+        elif args.command == "help":
+            from .subcommands.help_cmd import show_help
+
+            show_help(parser, args)
+
+        elif args.command == "history":
+            from .subcommands.history_cmd import show_history
+
+            show_history()
+
+        elif args.command == "models":
+            from .subcommands.list_models_cmd import list_models
+
+            list_models()
+
+        elif args.command == "pipelines":
+            from .subcommands.list_pipelines_cmd import list_pipelines
+
+            list_pipelines(pipeline_specs)
+
+        elif args.command == "rerun":
+            from .subcommands.run_cmd import rerun_command
+
+            rerun_command(pipeline_specs, args)
+
+        elif args.command == "run":
+            from .subcommands.run_cmd import run_command
+
+            run_command(pipeline_specs, args)
+
+        elif args.command == "format":
+            from .subcommands.format_cmd import format_command
+
+            format_command(pipeline_specs, args)
+
+        elif args.command == "summarize":
+            from .subcommands.summarize_cmd import summarize_command
+
+            summarize_command(pipeline_specs, args)
+
+        else:
+            parser.print_help()
+
+    except Exception as e:
+        print("Top level exception")
+        print(ExceptionContext.format_message(e))
+
+
+def add_add_ids_parser(subparsers):
     add_ids_parser = subparsers.add_parser("add-ids", help="Add uuids to a suite")
     add_ids_parser.add_argument("suite", type=str, help="The name of a file with cases")
     add_ids_parser.add_argument(
@@ -50,7 +117,8 @@ def main(pipelines: list[PipelineSpec]):
         help="Force adding UUIDs, even if they already exist",
     )
 
-    # 'compare' subcommand
+
+def add_compare_parser(subparsers):
     compare_parser = subparsers.add_parser(
         "compare", help="Compare two or more label sets"
     )
@@ -61,27 +129,28 @@ def main(pipelines: list[PipelineSpec]):
         "prefix_b", type=str, help="Filename prefix for run log B"
     )
 
-    # 'help' subcommand
+
+def add_help_parser(subparsers):
     help_parser = subparsers.add_parser("help", help="Show help for gotaglio commands")
     help_parser.add_argument(
         "subcommand", nargs="?", help="The subcommand to show help for"
     )
     help_parser.add_argument("args", nargs=argparse.REMAINDER, help=argparse.SUPPRESS)
 
-    # 'history' subcommand
-    history_parser = subparsers.add_parser(
-        "history", help="Show information about recent runs"
-    )
 
-    # 'models' subcommand
-    models_parser = subparsers.add_parser("models", help="List available models")
+def add_history_parser(subparsers):
+    subparsers.add_parser("history", help="Show information about recent runs")
 
-    # 'pipelines' subcommand
-    pipelines_parser = subparsers.add_parser(
-        "pipelines", help="List available pipelines"
-    )
 
-    # 'rerun' subcommand
+def add_models_parser(subparsers):
+    subparsers.add_parser("models", help="List available models")
+
+
+def add_pipelines_parser(subparsers):
+    subparsers.add_parser("pipelines", help="List available pipelines")
+
+
+def add_rerun_parser(subparsers):
     rerun_parser = subparsers.add_parser(
         "rerun", help="Rerun an experiment with modifications."
     )
@@ -93,7 +162,8 @@ def main(pipelines: list[PipelineSpec]):
         "key_values", nargs="*", help="key=value arguments to configure pipeline"
     )
 
-    # 'run' subcommand
+
+def add_run_parser(subparsers):
     run_parser = subparsers.add_parser("run", help="Run a named pipeline")
     run_parser.add_argument(
         "pipeline", type=str, help="The name of the pipeline to run"
@@ -107,7 +177,8 @@ def main(pipelines: list[PipelineSpec]):
         "key_values", nargs="*", help="key=value arguments to configure pipeline"
     )
 
-    # 'format' subcommand
+
+def add_format_parser(subparsers):
     format_parser = subparsers.add_parser("format", help="Pretty print a run")
     format_parser.add_argument(
         "prefix", type=str, help="Filename prefix for run log (or 'latest')"
@@ -119,50 +190,24 @@ def main(pipelines: list[PipelineSpec]):
         help="Optional case id prefix to show a single case",
     )
 
-    # 'summarize' subcommand
+
+def add_summarize_parser(subparsers):
     summarize_parser = subparsers.add_parser("summarize", help="Summarize a run")
     summarize_parser.add_argument(
         "prefix", type=str, help="Filename prefix for run log (or 'latest')"
     )
 
-    # Parse arguments
-    args = parser.parse_args()
-
-    # Route to the appropriate function based on the command
-    try:
-        if args.command == "add-ids":
-            add_ids(args.suite, args.force)
-
-        elif args.command == "compare":
-            compare_command(pipeline_specs, args)
-
-        elif args.command == "help":
-            show_help(parser, args)
-
-        elif args.command == "history":
-            show_history()
-
-        elif args.command == "models":
-            list_models()
-
-        elif args.command == "pipelines":
-            list_pipelines(pipeline_specs)
-
-        elif args.command == "rerun":
-            rerun_command(pipeline_specs, args)
-
-        elif args.command == "run":
-            run_command(pipeline_specs, args)
-
-        elif args.command == "format":
-            format_command(pipeline_specs, args)
-
-        elif args.command == "summarize":
-            summarize_command(pipeline_specs, args)
 
-        else:
-            parser.print_help()
-
-    except Exception as e:
-        print("Top level exception")
-        print(ExceptionContext.format_message(e))
+# Subparser builders, in the order they are listed in the help text.
+subparser_builders = {
+    "add-ids": add_add_ids_parser,
+    "compare": add_compare_parser,
+    "help": add_help_parser,
+    "history": add_history_parser,
+    "models": add_models_parser,
+    "pipelines": add_pipelines_parser,
+    "rerun": add_rerun_parser,
+    "run": add_run_parser,
+    "format": add_format_parser,
+    "summarize": add_summarize_parser,
+}
@@ -1,10 +1,13 @@
 from abc import ABC, abstractmethod
+import asyncio
+from functools import lru_cache
+import os
 from typing import Any, cast
 
 from .constants import app_configuration
 from .exceptions import ExceptionContext
 from .lazy_imports import azure_ai_inference, azure_core_credentials, openai, websockets
-from .shared import read_data_file
+from .shared import clone_json, find_data_file, read_data_file
 
 
 class Model(ABC):
@@ -37,7 +40,10 @@ class AzureAI(Model):
                 credential=azure_core_credentials.AzureKeyCredential(key),
             )
 
-        response = self._client.complete(messages=messages)
+        # The azure.ai.inference async client needs aiohttp, which is not a
+        # dependency, so run the blocking call on a worker thread to keep it
+        # from stalling the other cases on the event loop.
+        response = await asyncio.to_thread(self._client.complete, messages=messages)
 
         return cast(str, response.choices[0].message.content)
 
@@ -56,7 +62,7 @@ class AzureOpenAI(Model):
             endpoint = self._config["endpoint"]
             key = self._config["key"]
             api = self._config["api"]
-            self._client = openai.AzureOpenAI(
+            self._client = openai.AsyncAzureOpenAI(
                 api_key=key,
                 api_version=api,
                 azure_endpoint=endpoint,
@@ -70,7 +76,7 @@ class AzureOpenAI(Model):
         frequency_penalty = settings.get("frequency_penalty", 0)
         presence_penalty = settings.get("presence_penalty", 0)
 
-        response = self._client.chat.completions.create(
+        response = await self._client.chat.completions.create(
             model=self._config["deployment"],
             messages=messages,
             max_tokens=max_tokens,
@@ -106,7 +112,7 @@ class AzureOpenAI5(Model):
             endpoint = self._config["endpoint"]
             key = self._config["key"]
             api = self._config["api"]
-            self._client = openai.AzureOpenAI(
+            self._client = openai.AsyncAzureOpenAI(
                 api_key=key,
                 api_version=api,
                 azure_endpoint=endpoint,
@@ -123,7 +129,7 @@ class AzureOpenAI5(Model):
         frequency_penalty = settings.get("frequency_penalty", 0)
         presence_penalty = settings.get("presence_penalty", 0)
 
-        response = self._client.chat.completions.create(
+        response = await self._client.chat.completions.create(
             model=self._config["deployment"],
             messages=messages,
             max_completion_tokens=max_completion_tokens,
@@ -139,47 +145,77 @@ class AzureOpenAI5(Model):
         return {k: v for k, v in self._config.items() if k != "key"}
 
 
-from .azure_openai_realtime import AzureOpenAIRealtime  # re-export for public API
+def __getattr__(name):
+    # AzureOpenAIRealtime is re-exported for the public API, but it is only
+    # imported on first use so that commands that never construct a realtime
+    # model don't pay for loading it.
+    if name == "AzureOpenAIRealtime":
+        from .azure_openai_realtime import AzureOpenAIRealtime
+
+        return AzureOpenAIRealtime
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def azure_openai_realtime(registry, configuration):
+    # Defer loading the realtime model until a configuration uses it.
+    from .azure_openai_realtime import AzureOpenAIRealtime
+
+    return AzureOpenAIRealtime(registry, configuration)
+
+
+# Model constructors, by the `type` field in the model configuration file.
+model_types = {
+    "AZURE_AI": AzureAI,
+    "AZURE_OPEN_AI": AzureOpenAI,
+    "AZURE_OPEN_AI_5": AzureOpenAI5,
+    "AZURE_OPEN_AI_REALTIME": azure_openai_realtime,
+}
+
+
+def read_first_data_file(filenames):
+    """
+    Returns the content of the first file in `filenames` that exists and is
+    not empty, or None. Files are searched for in the parent directories.
+    """
+    for filename in filenames:
+        path = find_data_file(filename, True)
+        if path is not None:
+            data = read_data_file_cached(str(path), os.path.getmtime(path))
+            if data:
+                return data
+    return None
+
+
+# The model configuration and credentials are read each time a Director is
+# created, e.g. for each run through the Gotaglio API. Keying on mtime picks
+# up edits to the files.
+@lru_cache(maxsize=8)
+def read_data_file_cached(path, mtime):
+    return read_data_file(path)
 
 
 def register_models(registry):
     config_files = app_configuration["model_config_files"]
     credentials_files = app_configuration["model_credentials_files"]
 
-    # Read the model configuration file
-    config = None
-    for config_file in config_files:
-        config = read_data_file(config_file, True, True)
-        if config:
-            break
+    # Read the model configuration file. The configuration is copied because
+    # the keys are merged into it and the models hold on to it.
+    config = clone_json(read_first_data_file(config_files))
 
     # Read the credentials file
-    credentials = None
-    for credentials_file in credentials_files:
-        credentials = read_data_file(credentials_file, True, True)
-        if credentials:
-            break
-
-    if config and credentials:
-        # Merge in keys from credentials file
-        for model in config:
-            if model["name"] in credentials:
-                model["key"] = credentials[model["name"]]
+    credentials = read_first_data_file(credentials_files)
 
     if config:
-        # Construct and register models.
+        # Merge in keys from the credentials file, then construct and register
+        # the models.
         # TODO: lazy construction of models on first use
         for model in config:
             with ExceptionContext(f"While registering model '{model['name']}':"):
-                if model["type"] == "AZURE_AI":
-                    AzureAI(registry, model)
-                elif model["type"] == "AZURE_OPEN_AI":
-                    AzureOpenAI(registry, model)
-                elif model["type"] == "AZURE_OPEN_AI_5":
-                    AzureOpenAI5(registry, model)
-                elif model["type"] == "AZURE_OPEN_AI_REALTIME":
-                    AzureOpenAIRealtime(registry, model)
-                else:
+                if credentials and model["name"] in credentials:
+                    model["key"] = credentials[model["name"]]
+                model_class = model_types.get(model["type"])
+                if model_class is None:
                     raise ValueError(
                         f"Model {model['name']} has unsupported model type: {model['type']}"
                     )
+                model_class(registry, model)
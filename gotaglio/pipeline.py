@@ -1,5 +1,6 @@
 from datetime import datetime, timedelta, timezone
 import traceback
+from types import MappingProxyType
 from typing import Any, Callable
 
 from .dag import run_dag
@@ -10,6 +11,12 @@ from .registry import Registry
 from .shared import apply_patch, flatten_dict
 from .pipeline_spec import PipelineSpec
 
+# Shared, read-only configuration for the model mocks registered by every
+# Pipeline. The mocks never mutate their configuration, so a single immutable
+# instance avoids allocating a fresh dict per Pipeline. A mock that needs a
+# mutable configuration must construct its own.
+_EMPTY_MOCK_CONFIG = MappingProxyType({})
+
 
 class Pipeline:
     def __init__(
@@ -36,8 +43,8 @@ class Pipeline:
         # NOTE: this must be done before spec.create_dag, which accesses
         # models from the registry.
         registry = Registry(global_registry)
-        Flakey(registry, spec.expected, {})
-        Perfect(registry, spec.expected, {})
+        Flakey(registry, spec.expected, _EMPTY_MOCK_CONFIG)
+        Perfect(registry, spec.expected, _EMPTY_MOCK_CONFIG)
 
         # Create the DAG.
         turn_dag = spec.create_dag(spec.name, self._config, registry)
@@ -101,22 +108,38 @@ def ensure_required_configs(name, default_config, config):
     Raises:
         ValueError: If any setting in the configuration is `None`.
     """
-    settings = flatten_dict(config)
     with ExceptionContext(f"Pipeline '{name}' checking settings."):
-        for k, v in settings.items():
-            if isinstance(v, Prompt):
-                lines = [
-                    f"{name} pipeline: missing '{k}' parameter.",
-                    "",
-                    "Required settings:",
-                ]
-                prompts = [
-                    (k, v)
-                    for k, v in flatten_dict(default_config).items()
-                    if isinstance(v, Prompt)
-                ]
-                lines.extend([f"  {k}: {v._description}" for k, v in prompts])
-                raise ValueError("\n".join(lines))
+        path = find_prompt(config)
+        if path is not None:
+            lines = [
+                f"{name} pipeline: missing '{'.'.join(map(str, path))}' parameter.",
+                "",
+                "Required settings:",
+            ]
+            prompts = [
+                (k, v)
+                for k, v in flatten_dict(default_config).items()
+                if isinstance(v, Prompt)
+            ]
+            lines.extend([f"  {k}: {v._description}" for k, v in prompts])
+            raise ValueError("\n".join(lines))
+
+
+def find_prompt(node, path=()):
+    """
+    Returns the key path of the first Prompt in a configuration, or None.
+
+    The configuration is walked in place, so no flattened copy is built
+    unless a Prompt is actually found.
+    """
+    if isinstance(node, Prompt):
+        return path
+    if isinstance(node, dict):
+        for key, value in node.items():
+            result = find_prompt(value, path + (key,))
+            if result is not None:
+                return result
+    return None
 
 
 async def process_one_case(
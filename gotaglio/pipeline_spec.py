@@ -68,12 +68,14 @@ class PipelineSpecs:
 
     def __init__(self, pipelines: list[PipelineSpec]):
         self.pipelines = pipelines
+        # If names are repeated, the first spec with a given name wins.
+        self._by_name = {p.name: p for p in reversed(pipelines)}
 
     def get(self, name: str) -> PipelineSpec:
         """
         Retrieve a PipelineSpec by name.
         """
-        spec = next((p for p in self.pipelines if p.name == name), None)
+        spec = self._by_name.get(name)
         if spec is None:
             raise ValueError(f"Cannot find pipeline '{name}'.")
         return spec
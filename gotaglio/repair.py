@@ -1,5 +1,6 @@
 from copy import deepcopy
-from typing import TypedDict
+import functools
+from typing import Any, NamedTuple
 from . import lazy_imports
 
 
@@ -9,13 +10,13 @@ class EditType:
     REPAIR = "REPAIR"
 
 
-class Edit(TypedDict):
-    op: EditType
+class Edit(NamedTuple):
+    op: str
     cost: float
     steps: list[str]
 
 
-class DiffResult(TypedDict):
+class DiffResult(NamedTuple):
     cost: float
     edits: list[Edit]
 
@@ -56,8 +57,10 @@ class Repair:
         self._idAttr = idAttr
         self._childrenAttr = childrenAttr
         self._ignoreAttrs = ignoreAttrs
-        self._atomicAttrs = atomicAttrs
-        self._excludedAttrs = [idAttr, childrenAttr] + ignoreAttrs + atomicAttrs
+        self._atomicAttrs = frozenset(atomicAttrs)
+        self._excludedAttrs = frozenset(
+            [idAttr, childrenAttr, *ignoreAttrs, *atomicAttrs]
+        )
         self._nameAttr = nameAttr
 
         # _rootCounter is used to keep track of next available top-level id.
@@ -66,13 +69,31 @@ class Repair:
         # call pick up with the next id.
         self._rootCounter = 0
 
-    def addIds(self, root: dict | list[dict]) -> dict:
+        # Per-diff memoization of edits, keyed by node identity. Observed and
+        # expected trees are alive for the duration of a diff() call, so id()
+        # is stable. The caches are cleared when diff() returns. Cached Edits
+        # are shared, so callers must not mutate them.
+        self._repairCache = {}
+        self._insertCache = {}
+        self._deleteCache = {}
+
+        # Per-diff memoization of costs and of the child assignments chosen
+        # for each (observed, expected) pair. The cost matrices only use
+        # costs; Edits, with their formatted steps, are materialized just for
+        # the assigned cells.
+        self._repairCostCache = {}
+        self._insertCostCache = {}
+        self._childMatchCache = {}
+        self._featuresCache = {}
+
+    def addIds(self, root: dict | list[dict], in_place: bool = False) -> dict:
         """
         Add unique integer ids to a tree.
 
         Returns a deep copy of `root` with each node annotated with a unique integer
         identifier. Identifiers are unique across all calls to `Repair.addIds()` for
-        an instance of `Repair`.
+        an instance of `Repair`. When `in_place` is True, `root` itself is annotated
+        and returned, avoiding the copy for callers that own the tree.
 
         Tree structure, including the `id` attribute and the `children` attribute is
         defined in the constructor of the `Repair` class.
@@ -81,14 +102,16 @@ class Repair:
         ----------
         root: dict | list[dict]
             The object to be labeled with unique ids.
+        in_place: bool
+            If True, modify `root` instead of a copy.
 
         Returns
         -------
         dict | list[dict]
-            The copy with ids added.
+            The tree with ids added.
 
         """
-        r = deepcopy(root)
+        r = root if in_place else deepcopy(root)
         nodes = r if type(r) == list else [r]
         for n in nodes:
             prefix = self._rootCounter
@@ -99,178 +122,305 @@ class Repair:
     def resetIds(self):
         self._rootCounter = 0
 
-    def diff(self, observed: dict | list[dict], expected: dict | list[dict]) -> Edit:
+    def diff(
+        self, observed: dict | list[dict], expected: dict | list[dict]
+    ) -> dict[str, Any]:
         """
         Compute the minimum repair cost and corresponding repair steps
         to modify `observed` to be identical to `expected`.
+
+        Returns the repair `Edit` as a dict with `op`, `cost`, and `steps`
+        keys, suitable for recording in a run log.
         """
         o = observed if type(observed) == list else [observed]
         e = expected if type(expected) == list else [expected]
 
-        result = self._bipartiteMatchingDiff(o, e)
-
-        return {
-            "op": EditType.REPAIR,
-            "cost": result["cost"],
-            "steps": [step for edit in result["edits"] for step in edit["steps"]],
-        }
+        # The caches are keyed by id(), so they must not carry entries from
+        # objects that may have been freed since they were populated.
+        self._clearCaches()
+        try:
+            result = self._bipartiteMatchingDiff(o, e)
+        finally:
+            self._clearCaches()
+
+        return Edit(
+            op=EditType.REPAIR,
+            cost=result.cost,
+            steps=[step for edit in result.edits for step in edit.steps],
+        )._asdict()
+
+    def _clearCaches(self):
+        self._repairCache.clear()
+        self._insertCache.clear()
+        self._deleteCache.clear()
+        self._repairCostCache.clear()
+        self._insertCostCache.clear()
+        self._childMatchCache.clear()
+        self._featuresCache.clear()
 
     def _addIdsImpl(self, node, prefix):
-        if self._idAttr in node:
-            raise RuntimeError(f"Attempting to override value in {self._idAttr} attribute.")
-        node[self._idAttr] = prefix
-        if self._childrenAttr in node:
-            for i, child in enumerate(node[self._childrenAttr]):
-                childPrefix = prefix + "." + str(i)
-                self._addIdsImpl(child, childPrefix)
+        # Walk the tree with an explicit stack to avoid recursion overhead
+        # and the recursion limit on deep trees.
+        idAttr = self._idAttr
+        childrenAttr = self._childrenAttr
+        stack = [(node, prefix)]
+        while stack:
+            node, prefix = stack.pop()
+            if idAttr in node:
+                raise RuntimeError(f"Attempting to override value in {idAttr} attribute.")
+            node[idAttr] = prefix
+            if childrenAttr in node:
+                for i, child in enumerate(node[childrenAttr]):
+                    stack.append((child, f"{prefix}.{i}"))
 
     def _formatStep(self, item, message):
         uuid = item[self._idAttr] if self._idAttr in item else "???"
         name = item[self._nameAttr] if self._nameAttr in item else "???"
         return f"{uuid}: {name}: {message}"
 
+    def _deleteCost(self, item: dict) -> float:
+        """
+        Compute the cost to delete `item`.
+        """
+        return 1
+
     def _delete(self, item: dict) -> Edit:
         """
         Compute the cost and steps to delete `item`.
         """
-        return {
-            "op": EditType.DELETE,
-            "cost": 1,
-            "steps": [self._formatStep(item, f"delete item")],
-        }
+        edit = self._deleteCache.get(id(item))
+        if edit is None:
+            edit = Edit(
+                op=EditType.DELETE,
+                cost=self._deleteCost(item),
+                steps=[self._formatStep(item, f"delete item")],
+            )
+            self._deleteCache[id(item)] = edit
+        return edit
+
+    def _insertCost(self, item: dict) -> float:
+        """
+        Compute the cost to insert `item`.
+        """
+        cost = self._insertCostCache.get(id(item))
+        if cost is None:
+            attrs, _ = self._features(item)
+
+            # Insert the generic item's default form
+            cost = 1
+
+            # Non-standard attributes
+            cost += len(attrs) - (1 if self._nameAttr in attrs else 0)
+
+            # Cost of adding children
+            if self._childrenAttr in item:
+                for child in item[self._childrenAttr]:
+                    cost += self._insertCost(child)
+
+            self._insertCostCache[id(item)] = cost
+        return cost
 
     def _insert(self, item: dict) -> Edit:
         """
         Compute the cost and steps to insert `item`.
         """
-        cost = 0
-        steps = []
-
-        # Insert the generic item's default form
-        cost += 1
-        steps.append(self._formatStep(item, "insert default version"))
-
-        # Non-standard attributes
-        for attr in [
-            k for k in item if k not in self._excludedAttrs and k != self._nameAttr
-        ]:
-            cost += 1
-            steps.append(
-                self._formatStep(item, f"change attribute({attr}) to '{item[attr]}'")
-            )
+        edit = self._insertCache.get(id(item))
+        if edit is None:
+            attrs, _ = self._features(item)
+            nameAttr = self._nameAttr
+            steps = [self._formatStep(item, "insert default version")]
+            for attr, value in attrs.items():
+                if attr != nameAttr:
+                    steps.append(
+                        self._formatStep(item, f"change attribute({attr}) to '{value}'")
+                    )
+            if self._childrenAttr in item:
+                for child in item[self._childrenAttr]:
+                    steps += self._insert(child).steps
 
-        # Cost of adding children
-        if self._childrenAttr in item:
-            for child in item[self._childrenAttr]:
-                edit = self._insert(child)
-                cost += edit["cost"]
-                steps += edit["steps"]
+            edit = Edit(op=EditType.INSERT, cost=self._insertCost(item), steps=steps)
+            self._insertCache[id(item)] = edit
+        return edit
 
-        return {"op": EditType.INSERT, "cost": cost, "steps": steps}
+    def _features(self, node: dict):
+        """
+        Returns a pair of dicts for `node`: the attributes that are repaired
+        individually and the atomic attributes. Each node takes part in a
+        full row or column of the cost matrix, so the features are computed
+        once per node per diff.
+        """
+        features = self._featuresCache.get(id(node))
+        if features is None:
+            excluded = self._excludedAttrs
+            atomic = self._atomicAttrs
+            features = (
+                {k: v for k, v in node.items() if k not in excluded},
+                {k: v for k, v in node.items() if k in atomic},
+            )
+            self._featuresCache[id(node)] = features
+        return features
+
+    def _repairCost(self, observed: dict, expected: dict) -> float:
+        """
+        Compute the cost to edit `observed` to be identical to `expected`.
+        """
+        key = (id(observed), id(expected))
+        cost = self._repairCostCache.get(key)
+        if cost is None:
+            observedAttrs, observedAtomic = self._features(observed)
+            expectedAttrs, expectedAtomic = self._features(expected)
+            if observedAtomic != expectedAtomic:
+                # This case used to just set cost to Infinity.
+                # Changed code to do a delete, followed by an insert
+                # with the score slightly diminished so that the system
+                # prefers delete-before insert. This is important for
+                # working with options that cannot coexist.
+                cost = self._deleteCost(observed)
+                cost += self._insertCost(expected)
+                cost -= 0.001
+            else:
+                # Repair attributes
+                cost = 0
+                for attr, value in expectedAttrs.items():
+                    if attr not in observedAttrs or observedAttrs[attr] != value:
+                        cost += 1
+                for attr in observedAttrs:
+                    if attr not in expectedAttrs:
+                        cost += 1
+
+                # Repair children
+                oc = observed[self._childrenAttr] if self._childrenAttr in observed else []
+                ec = expected[self._childrenAttr] if self._childrenAttr in expected else []
+                match = self._bipartiteMatching(oc, ec)
+                self._childMatchCache[key] = match
+                cost += match[0]
+
+            self._repairCostCache[key] = cost
+        return cost
 
     def _repair(self, observed: dict, expected: dict) -> Edit:
         """
         Compute the cost and steps to edit `observed` to be identical to `expected`.
         """
-        cost = 0
-        steps = []
-
-        expectedAtomic = any(
-            [
-                (x not in expected or observed[x] != expected[x])
-                for x in observed
-                if x in self._atomicAttrs
-            ]
-        )
-        observedAtomic = any(
-            [
-                (x not in observed or observed[x] != expected[x])
-                for x in expected
-                if x in self._atomicAttrs
-            ]
-        )
-
-        if expectedAtomic or observedAtomic:
-            # This case used to just set cost to Infinity.
-            # Changed code to do a delete, followed by an insert
-            # with the score slightly diminished so that the system
-            # prefers delete-before insert. This is important for
-            # working with options that cannot coexist.
-            deleteResults = self._delete(observed)
-            steps += deleteResults["steps"]
-            cost = deleteResults["cost"]
-            insertResults = self._insert(expected)
-            steps += insertResults["steps"]
-            cost += insertResults["cost"]
-            cost -= 0.001
-        else:
-            # Repair attributes
-            for attr in [x for x in expected if x not in self._excludedAttrs]:
-                if attr not in observed:
-                    cost += 1
-                    steps.append(
-                        self._formatStep(observed, f"set {attr} to `{expected[attr]}`")
-                    )
-                elif observed[attr] != expected[attr]:
-                    cost += 1
-                    steps.append(
-                        self._formatStep(
-                            observed, f"change {attr} to `{expected[attr]}`"
+        key = (id(observed), id(expected))
+        edit = self._repairCache.get(key)
+        if edit is None:
+            cost = self._repairCost(observed, expected)
+            steps = []
+            observedAttrs, observedAtomic = self._features(observed)
+            expectedAttrs, expectedAtomic = self._features(expected)
+            if observedAtomic != expectedAtomic:
+                # Delete, then insert. See _repairCost().
+                steps += self._delete(observed).steps
+                steps += self._insert(expected).steps
+            else:
+                # Repair attributes
+                for attr, value in expectedAttrs.items():
+                    if attr not in observedAttrs:
+                        steps.append(
+                            self._formatStep(observed, f"set {attr} to `{value}`")
                         )
-                    )
-            for attr in [
-                x
-                for x in observed
-                if x not in expected and x not in self._excludedAttrs
-            ]:
-                cost += 1
-                steps.append(self._formatStep(observed, f"remove {attr}"))
-
-            # Repair children
-            oc = observed[self._childrenAttr] if self._childrenAttr in observed else []
-            ec = expected[self._childrenAttr] if self._childrenAttr in expected else []
-
-            result = self._bipartiteMatchingDiff(oc, ec)
-            cost += result["cost"]
-            steps += [step for edit in result["edits"] for step in edit["steps"]]
-
-        return {"op": EditType.REPAIR, "cost": cost, "steps": steps}
-
-    def _bipartiteMatchingDiff(self, a, b):
-        ops = []
-        al = len(a)
-        bl = len(b)
-        n = max(al, bl)
+                    elif observedAttrs[attr] != value:
+                        steps.append(
+                            self._formatStep(observed, f"change {attr} to `{value}`")
+                        )
+                for attr in observedAttrs:
+                    if attr not in expectedAttrs:
+                        steps.append(self._formatStep(observed, f"remove {attr}"))
+
+                # Repair children
+                oc = observed[self._childrenAttr] if self._childrenAttr in observed else []
+                ec = expected[self._childrenAttr] if self._childrenAttr in expected else []
+                _, assignments = self._childMatchCache[key]
+                for ai, bi in assignments:
+                    steps += self._cellEdit(oc, ec, ai, bi).steps
+
+            edit = Edit(op=EditType.REPAIR, cost=cost, steps=steps)
+            self._repairCache[key] = edit
+        return edit
+
+    def _cellCost(self, a, b, ai, bi) -> float:
+        if ai < len(a):
+            if bi < len(b):
+                return self._repairCost(a[ai], b[bi])
+            else:
+                return self._deleteCost(a[ai])
+        else:
+            return self._insertCost(b[bi])
+
+    def _cellEdit(self, a, b, ai, bi) -> Edit:
+        if ai < len(a):
+            if bi < len(b):
+                return self._repair(a[ai], b[bi])
+            else:
+                return self._delete(a[ai])
+        else:
+            return self._insert(b[bi])
+
+    def _bipartiteMatching(self, a, b):
+        """
+        Compute the minimum cost matching of `a` to `b`, using only costs.
+        Returns the total cost and the list of (ai, bi) assignments with
+        non-zero cost, where ai >= len(a) denotes an insert and bi >= len(b)
+        denotes a delete.
+        """
+        n = max(len(a), len(b))
 
         if n == 0:
-            return {"cost": 0, "edits": []}
+            return (0, [])
 
+        costs = lazy_imports.numpy.empty((n, n), dtype=float)
         for ai in range(n):
-            row = []
             for bi in range(n):
-                if ai < al:
-                    if bi < bl:
-                        row.append(self._repair(a[ai], b[bi]))
-                    else:
-                        row.append(self._delete(a[ai]))
-                else:
-                    row.append(self._insert(b[bi]))
-            ops.append(row)
-
-        # Project to 2D array of costs
-        costs = lazy_imports.numpy.array([[edit["cost"] for edit in row] for row in ops])
-
-        # Perform Munkres assignment
-        ri, ci = lazy_imports.scipy_optimize.linear_sum_assignment(costs)
-        assignments = zip(ri, ci)
-
-        #  Map assignments back to list of operations.
-        edits = [
-            edit for edit in [ops[x[0]][x[1]] for x in assignments] if edit["cost"] != 0
+                costs[ai, bi] = self._cellCost(a, b, ai, bi)
+
+        # Perform minimum cost assignment, keeping only the cells that
+        # require an edit.
+        assignments = [
+            (int(ai), int(bi))
+            for ai, bi in linear_sum_assignment(costs)
+            if costs[ai, bi] != 0
         ]
 
         # Total up the costs.
-        cost = sum([e["cost"] for e in edits])
+        cost = sum([self._cellCost(a, b, ai, bi) for ai, bi in assignments])
+
+        return (cost, assignments)
+
+    def _bipartiteMatchingDiff(self, a, b) -> DiffResult:
+        cost, assignments = self._bipartiteMatching(a, b)
+
+        #  Materialize edits only for the assigned cells.
+        edits = [self._cellEdit(a, b, ai, bi) for ai, bi in assignments]
 
         # Return cost and edits.
-        return {"cost": cost, "edits": edits}
+        return DiffResult(cost=cost, edits=edits)
+
+
+def linear_sum_assignment(costs):
+    """
+    Solve the assignment problem for the square `costs` matrix.
+
+    Returns an iterable of (row, column) pairs for the minimum cost
+    assignment. Uses the Jonker-Volgenant solver from the optional `lap`
+    package when it is installed, since it is several times faster than
+    scipy's Hungarian implementation on larger matrices. Falls back to
+    `scipy.optimize.linear_sum_assignment` otherwise.
+    """
+    lapjv = _lapjv()
+    if lapjv is None:
+        ri, ci = lazy_imports.scipy_optimize.linear_sum_assignment(costs)
+        return zip(ri, ci)
+
+    # lapjv requires a C-contiguous float64 matrix.
+    _, ci, _ = lapjv(lazy_imports.numpy.ascontiguousarray(costs, dtype=float))
+    return enumerate(ci)
+
+
+@functools.cache
+def _lapjv():
+    try:
+        import lap
+    except ImportError:
+        return None
+    return lap.lapjv
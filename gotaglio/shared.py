@@ -1,15 +1,36 @@
 import argparse
 from copy import deepcopy
-from glom import assign, glom
 import json
 import os
 from pathlib import Path
 import platform
+import uuid
 import yaml
 
 from .templating import jinja2_template
 from .constants import app_configuration
 
+# platform.system() is not free, and the answer never changes.
+_IS_MACOS = platform.system() == "Darwin"
+
+# orjson is an optional, considerably faster JSON codec. When it is not
+# installed, fall back to the standard library.
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Prefer the libyaml-backed loader and dumper, which are much faster than
+# the pure Python implementations, when PyYAML was built with libyaml.
+try:
+    from yaml import CSafeDumper as YamlSafeDumper, CSafeLoader as YamlSafeLoader
+except ImportError:
+    from yaml import SafeDumper as YamlSafeDumper, SafeLoader as YamlSafeLoader
+
+# YAML files are parsed incrementally from the open file. A larger buffer
+# than the default means fewer read() calls on big case files.
+_READ_BUFFER_SIZE = 64 * 1024
+
 
 def format_list(values):
     if not values:
@@ -26,11 +47,11 @@ def parse_key_value_args(args):
     """Parse key=value arguments into a dictionary."""
     config = {}
     for arg in args:
-        if "=" not in arg:
+        key, separator, value = arg.partition("=")
+        if not separator:
             raise argparse.ArgumentTypeError(
                 f"Invalid format: '{arg}'. Expected key=value."
             )
-        key, value = arg.split("=", 1)
         config[key] = value
     return config
 
@@ -45,25 +66,51 @@ def get_files_sorted_by_creation(folder_path):
     Returns:
         list: File names sorted by creation date.
     """
-    # Ensure the folder path is a Path object
-    folder = Path(folder_path)
-
-    # Get a list of files in the folder (excluding directories)
-    files = [(f.stem, get_creation_time(f)) for f in folder.iterdir() if f.is_file()]
+    # Get a list of files in the folder (excluding directories). The
+    # DirEntry objects from scandir() cache the file type and, on Windows,
+    # the stat results from the directory read itself.
+    with os.scandir(folder_path) as entries:
+        files = [
+            (os.path.splitext(entry.name)[0], creation_time_from_stat(entry.stat()))
+            for entry in entries
+            if entry.is_file()
+        ]
 
     # Sort files by creation time
-    sorted_files = sorted(files, key=lambda f: f[1])
+    files.sort(key=lambda f: f[1])
+
+    return files
+
 
-    return sorted_files
+def get_newest_file(folder_path):
+    """
+    Returns the name, without extension, of the most recently created file
+    in the specified folder, or None if the folder contains no files.
+
+    :param folder_path: Path to the folder to search.
+    """
+    with os.scandir(folder_path) as entries:
+        files = [
+            (entry.name, creation_time_from_stat(entry.stat()))
+            for entry in entries
+            if entry.is_file()
+        ]
+    if not files:
+        return None
+    # Among files with the same creation time, prefer the last one listed,
+    # matching the last entry of get_files_sorted_by_creation().
+    return os.path.splitext(max(reversed(files), key=lambda f: f[1])[0])[0]
 
 
 def get_creation_time(path):
-    if platform.system() == "Windows":
-        return os.path.getctime(path)
-    elif platform.system() == "Darwin":  # macOS
-        return os.stat(path).st_birthtime
-    else:  # Linux and other Unix-like systems
-        return os.stat(path).st_ctime
+    return creation_time_from_stat(os.stat(path))
+
+
+def creation_time_from_stat(stat_result):
+    if _IS_MACOS:
+        return stat_result.st_birthtime
+    else:  # Windows (st_ctime is creation time), Linux, and other Unix-like systems
+        return stat_result.st_ctime
 
 
 def get_filenames_with_prefix(folder_path, prefix):
@@ -74,12 +121,14 @@ def get_filenames_with_prefix(folder_path, prefix):
     :param prefix: The prefix to filter filenames.
     :return: List of filenames that start with the prefix.
     """
-    filenames = [
-        filename
-        for filename in os.listdir(folder_path)
-        if os.path.isfile(os.path.join(folder_path, filename))
-        and filename.startswith(prefix)
-    ]
+    # Check the prefix first. is_file() may need a stat() call when the
+    # file system does not report entry types.
+    with os.scandir(folder_path) as entries:
+        filenames = [
+            entry.name
+            for entry in entries
+            if entry.name.startswith(prefix) and entry.is_file()
+        ]
     return filenames
 
 
@@ -87,13 +136,51 @@ def read_log_file_from_prefix(prefix):
     return read_json_file(log_file_name_from_prefix(prefix))
 
 
+def rerun_inputs(runlog):
+    """
+    Returns the pipeline metadata and the list of cases recorded in `runlog`,
+    for use in rerunning those cases.
+    """
+    metadata = runlog["metadata"]
+    if "pipeline" not in metadata:
+        raise Exception("No pipeline metadata found in results file")
+    return metadata["pipeline"], [record["case"] for record in runlog["results"]]
+
+
+def log_folder_exists():
+    """
+    Returns True if the log folder exists. Otherwise prints a message for
+    the user and returns False.
+    """
+    log_folder = app_configuration["log_folder"]
+    if not os.path.exists(log_folder):
+        print(f"No log folder '{log_folder}'.")
+        return False
+    return True
+
+
+def read_log_file_and_spec(pipeline_specs, prefix):
+    """
+    Used by subcommands that display a run log.
+
+    :param pipeline_specs: The PipelineSpecs used to look up the pipeline.
+    :param prefix: Filename prefix for the run log (or 'latest').
+    :return: The run log and the spec of the pipeline that produced it, or
+        None if there is no log folder.
+    """
+    if not log_folder_exists():
+        return None
+    runlog = read_log_file_from_prefix(prefix)
+    return runlog, pipeline_specs.get(runlog["metadata"]["pipeline"]["name"])
+
+
 def log_file_name_from_prefix(prefix):
     log_folder = app_configuration["log_folder"]
     if prefix.lower() == "latest":
-        filenames = get_files_sorted_by_creation(log_folder)
-        if not filenames:
+        newest = get_newest_file(log_folder)
+        if newest is None:
             raise ValueError(f"No runs found in {log_folder}'.")
-        return os.path.join(log_folder, filenames[-1][0] + ".json")
+        return os.path.join(log_folder, newest + ".json")
     else:
         filenames = get_filenames_with_prefix(log_folder, prefix)
         if not filenames:
@@ -115,11 +202,43 @@ def read_text_file(filename):
 def read_json_file(filename, optional=False):
     if optional and not os.path.isfile(filename):
         return {}
-    with open(filename, "r", encoding="utf-8") as file:
-        result = json.load(file)
+    with open(filename, "rb") as file:
+        result = json_loads(file.read())
     return result
 
 
+def find_data_file(filename, search=False):
+    """
+    Find a file, optionally searching parent directories.
+
+    :param filename: The path to the file to find.
+    :param search: If True, search for the file in parent directories.
+    :return: The Path of the file, or None if the file does not exist.
+    """
+    search_path = Path.cwd()
+
+    # First try the direct path
+    file_path = Path(filename)
+    if file_path.is_absolute():
+        return file_path if file_path.exists() else None
+
+    # If not absolute, try relative to search_path
+    candidate = search_path / filename
+    if candidate.exists():
+        return candidate
+
+    # If search is enabled, look in parent directories
+    if search:
+        current = search_path
+        while current != current.parent:  # Stop at root
+            candidate = current / filename
+            if candidate.exists():
+                return candidate
+            current = current.parent
+
+    return None
+
+
 def read_data_file(filename, optional=False, search=False):
     """
     Find and read a json or yaml file and return its content.
@@ -139,34 +258,8 @@ def read_data_file(filename, optional=False, search=False):
     :return: The content of the file as a dictionary or an empty dictionary if the file does not exist.
     """
 
-    def find_file(filename, search_path=None):
-        """Helper function to find a file, optionally searching parent directories."""
-        if search_path is None:
-            search_path = Path.cwd()
-
-        # First try the direct path
-        file_path = Path(filename)
-        if file_path.is_absolute():
-            return file_path if file_path.exists() else None
-
-        # If not absolute, try relative to search_path
-        candidate = search_path / filename
-        if candidate.exists():
-            return candidate
-
-        # If search is enabled, look in parent directories
-        if search:
-            current = search_path
-            while current != current.parent:  # Stop at root
-                candidate = current / filename
-                if candidate.exists():
-                    return candidate
-                current = current.parent
-
-        return None
-
     # Find the file
-    file_path = find_file(filename)
+    file_path = find_data_file(filename, search)
 
     if file_path is None:
         if optional:
@@ -178,15 +271,18 @@ def read_data_file(filename, optional=False, search=False):
     suffix = file_path.suffix.lower()
 
     try:
-        with open(file_path, "r", encoding="utf-8") as file:
-            if suffix == ".json":
-                return json.load(file)
-            elif suffix in [".yaml", ".yml"]:
-                return yaml.safe_load(file)
-            else:
-                raise ValueError(
-                    f"Unsupported file format: {suffix}. Only .json, .yaml, and .yml are supported."
-                )
+        if suffix == ".json":
+            with open(file_path, "rb") as file:
+                return json_loads(file.read())
+        elif suffix in [".yaml", ".yml"]:
+            with open(
+                file_path, "r", encoding="utf-8", buffering=_READ_BUFFER_SIZE
+            ) as file:
+                return yaml.load(file, Loader=YamlSafeLoader)
+        else:
+            raise ValueError(
+                f"Unsupported file format: {suffix}. Only .json, .yaml, and .yml are supported."
+            )
     except (json.JSONDecodeError, yaml.YAMLError) as e:
         raise ValueError(f"Error parsing {suffix} file '{file_path}': {e}")
     except Exception as e:
@@ -194,8 +290,8 @@ def read_data_file(filename, optional=False, search=False):
 
 
 def write_json_file(filename, data):
-    with open(filename, "w", encoding="utf-8") as file:
-        json.dump(data, file, indent=2, ensure_ascii=False)
+    with open(filename, "wb") as file:
+        file.write(json_dumps(data))
 
 
 def write_data_file(filename, data):
@@ -208,15 +304,15 @@ def write_data_file(filename, data):
     :param data: The data to write to the file.
     """
     suffix = Path(filename).suffix.lower()
-    with open(filename, "w", encoding="utf-8") as file:
-        if suffix == ".json":
-            json.dump(data, file, indent=2, ensure_ascii=False)
-        elif suffix in [".yaml", ".yml"]:
-            yaml.safe_dump(data, file, allow_unicode=True)
-        else:
-            raise ValueError(
-                f"Unsupported file format: {suffix}. Only .json, .yaml, and .yml are supported."
-            )
+    if suffix == ".json":
+        write_json_file(filename, data)
+    elif suffix in [".yaml", ".yml"]:
+        with open(filename, "w", encoding="utf-8") as file:
+            yaml.dump(data, file, Dumper=YamlSafeDumper, allow_unicode=True)
+    else:
+        raise ValueError(
+            f"Unsupported file format: {suffix}. Only .json, .yaml, and .yml are supported."
+        )
 
 
 def write_log_file(runlog, filename: str | None = None, chatty: bool = False):
@@ -227,9 +323,7 @@ def write_log_file(runlog, filename: str | None = None, chatty: bool = False):
     )
 
     # Write results to log file
-    log_folder = app_configuration["log_folder"]
-    if not os.path.exists(log_folder):
-        os.makedirs(log_folder)
+    os.makedirs(app_configuration["log_folder"], exist_ok=True)
     write_json_file(output_file, runlog)
 
     if chatty:
@@ -243,7 +337,46 @@ def to_json_string(data):
     :param data: The Python object to convert.
     :return: A JSON string representation of the object.
     """
-    return json.dumps(data, indent=2, ensure_ascii=False)
+    return json_dumps(data).decode("utf-8")
+
+
+def json_loads(data):
+    """
+    Parse JSON text (str or UTF-8 bytes). Uses orjson when it is installed.
+    Falls back to the standard library for documents orjson rejects, such
+    as those containing NaN, which `json` accepts.
+
+    Both parsers reuse a single string object for repeated object keys, so
+    the many records in a run log share their key strings without a
+    separate interning pass.
+    """
+    if orjson is not None:
+        try:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError:
+            pass
+    return json.loads(data)
+
+
+def json_dumps(data):
+    """
+    Serialize `data` to UTF-8 encoded JSON bytes, indented by two spaces and
+    without escaping non-ASCII characters. Uses orjson when it is installed.
+    Falls back to the standard library for values orjson cannot serialize,
+    such as integers wider than 64 bits.
+
+    The two serializers do not produce identical output. orjson writes NaN
+    and infinities as `null` where `json` writes `NaN` and `Infinity`, and
+    it writes small exponents without padding (`1e-7` rather than `1e-07`).
+    """
+    if orjson is not None:
+        try:
+            return orjson.dumps(
+                data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS
+            )
+        except orjson.JSONEncodeError:
+            pass
+    return json.dumps(data, indent=2, ensure_ascii=False).encode("utf-8")
 
 
 def parse_patches(path_bindings):
@@ -268,11 +401,30 @@ def apply_patch(target_dict, patches):
     :param target_dict: The dictionary to be copied and patched.
     :param patches: A dictionary with dot-separated keys and their corresponding values.
     """
-    result = deepcopy(target_dict)
+    result = clone_json(target_dict)
     apply_patch_in_place(result, patches)
     return result
 
 
+def clone_json(value):
+    """
+    Return a deep copy of a JSON-shaped value. Dicts and lists are copied
+    recursively and immutable scalars are shared, which is considerably
+    faster than `deepcopy`. Any other value (e.g. a `Prompt` placeholder in
+    a pipeline configuration) falls back to `deepcopy`.
+
+    :param value: The value to copy.
+    """
+    if isinstance(value, dict):
+        return {k: clone_json(v) for k, v in value.items()}
+    elif isinstance(value, list):
+        return [clone_json(v) for v in value]
+    elif value is None or isinstance(value, (str, int, float, bool)):
+        return value
+    else:
+        return deepcopy(value)
+
+
 def apply_patch_in_place(target_dict, patches):
     """
     Modify an existing dictionary by applying a series of dot-separated
@@ -286,7 +438,8 @@ def apply_patch_in_place(target_dict, patches):
         if isinstance(value, dict):
             raise ValueError(f"Invalid patch for '{key}'. Value cannot be a dict.")
         # Ensure result[key] is not a dict
-        node = glom(target_dict, key, default=None)
+        path = key.split(".")
+        node = get_path(target_dict, path)
         if isinstance(node, dict):
             candidates = [k for k in node.keys() if not isinstance(node[k], dict)]
             tip = (
@@ -297,7 +450,80 @@ def apply_patch_in_place(target_dict, patches):
             raise ValueError(
                 f"Invalid patch for '{key}={value}'. Patch would overwrite a dict. {tip}"
             )
-        assign(target_dict, key, value, missing=dict)
+        set_path(target_dict, path, value)
+
+
+def get_path(target, path, default=None):
+    """
+    Return the value at `path` in a tree of nested dicts and lists, or
+    `default` if the path does not exist. As with glom, a numeric key
+    indexes into a list.
+
+    :param target: The root dictionary.
+    :param path: Sequence of keys, e.g. "a.b.c".split(".").
+    :param default: Value returned when the path does not exist.
+    """
+    node = target
+    for key in path:
+        if isinstance(node, dict):
+            if key not in node:
+                return default
+            node = node[key]
+        elif isinstance(node, list):
+            index = _list_index(node, key)
+            if index is None:
+                return default
+            node = node[index]
+        else:
+            return default
+    return node
+
+
+def set_path(target, path, value):
+    """
+    Set the value at `path` in a tree of nested dicts and lists, creating
+    intermediate dicts as needed. A numeric key indexes into an existing
+    list element; lists are never extended.
+
+    :param target: The root dictionary.
+    :param path: Sequence of keys, e.g. "a.b.c".split(".").
+    :param value: The value to store.
+    """
+    node = target
+    for key in path[:-1]:
+        if isinstance(node, list):
+            node = node[_required_list_index(node, key, path)]
+        else:
+            if key not in node:
+                node[key] = {}
+            node = node[key]
+        if not isinstance(node, (dict, list)):
+            raise ValueError(
+                f"Cannot set '{'.'.join(path)}': '{key}' is not a dictionary or list."
+            )
+    key = path[-1]
+    if isinstance(node, list):
+        key = _required_list_index(node, key, path)
+    node[key] = value
+
+
+def _list_index(node, key):
+    # Returns `key` as an index into the list `node`, or None if it is not
+    # an integer or is out of range.
+    try:
+        index = int(key)
+    except ValueError:
+        return None
+    return index if -len(node) <= index < len(node) else None
+
+
+def _required_list_index(node, key, path):
+    index = _list_index(node, key)
+    if index is None:
+        raise ValueError(
+            f"Cannot set '{'.'.join(path)}': '{key}' is not a valid list index."
+        )
+    return index
 
 
 def flatten_dict(d, parent_key="", sep="."):
@@ -325,42 +551,57 @@ def flatten_dict(d, parent_key="", sep="."):
     return items
 
 
+def uuid4_strings(count):
+    """
+    Generate `count` random (version 4) UUID strings, reading the random
+    bytes for all of them with a single os.urandom() call.
+
+    :param count: The number of UUIDs to generate.
+    :return: List of UUID strings.
+    """
+    random_bytes = os.urandom(16 * count)
+    return [
+        str(uuid.UUID(bytes=random_bytes[i : i + 16], version=4))
+        for i in range(0, 16 * count, 16)
+    ]
+
+
 def minimal_unique_prefix(uuids):
     """
-    Given a list of UUIDs, return a list of minimal length prefixes
-    that uniquely identify each UUID. All prefixes will have the length
-    of the longest required prefix.
+    Given a list of UUIDs, return the length of the shortest prefix that
+    uniquely identifies every UUID. This is the length of the longest of the
+    minimal unique prefixes, so that all prefixes can have the same length.
+
+    After sorting, the UUID sharing the longest common prefix with any given
+    UUID is one of its neighbors, so only adjacent pairs need to be compared.
 
     :param uuids: List of UUID strings
-    :return: List of minimal unique prefixes with uniform length
+    :return: Length of the minimal unique prefix, or 0 if `uuids` is empty.
     """
-    prefixes = []
-    max_length = 0
+    if not uuids:
+        return 0
 
-    # First pass: determine the minimal unique prefix for each UUID
-    for uuid in uuids:
-        for length in range(1, len(uuid) + 1):
-            prefix = uuid[:length]
-            # Check if prefix is unique among all UUIDs
-            if all(not other.startswith(prefix) or other == uuid for other in uuids):
-                prefixes.append(prefix)
-                max_length = max(max_length, length)
-                break
+    ordered = sorted(uuids)
+    longest_common = 0
+    for a, b in zip(ordered, ordered[1:]):
+        # Duplicate UUIDs do not need to be distinguished from each other.
+        if a != b:
+            longest_common = max(longest_common, len(os.path.commonprefix((a, b))))
 
-    return max_length
+    return longest_common + 1
 
 
 def build_template(config, template_file, template_source_text):
+    source_path = template_source_text.split(".")
+
     # If we don't have the template source text, load it from a file.
-    if not isinstance(
-        glom(config, template_source_text, default=None),
-        str,
-    ):
-        assign(
-            config,
-            template_source_text,
-            read_text_file(glom(config, template_file)),
-        )
+    source = get_path(config, source_path)
+    if not isinstance(source, str):
+        filename = get_path(config, template_file.split("."))
+        if filename is None:
+            raise ValueError(f"Missing configuration setting '{template_file}'.")
+        source = read_text_file(filename)
+        set_path(config, source_path, source)
 
     # Compile the template.
-    return jinja2_template(glom(config, "prepare.template_text"))
+    return jinja2_template(source)
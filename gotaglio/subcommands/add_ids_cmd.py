@@ -1,16 +1,13 @@
-import uuid
-
-from ..shared import read_json_file, write_json_file
+from ..shared import read_json_file, uuid4_strings, write_json_file
 
 def add_ids(filename, force):
     print(f"Adding IDs to {filename}. Force: {force}")
 
     cases = read_json_file(filename, False)
-    add_count = 0
-    for case in cases:
-        if "uuid" not in case or force:
-            case["uuid"] = str(uuid.uuid4())
-            add_count += 1
+    targets = [case for case in cases if "uuid" not in case or force]
+    for case, id in zip(targets, uuid4_strings(len(targets))):
+        case["uuid"] = id
+    add_count = len(targets)
 
     write_json_file(filename, cases)
 
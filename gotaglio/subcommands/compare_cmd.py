@@ -1,22 +1,33 @@
-import os
+from concurrent.futures import ThreadPoolExecutor
 
-from ..compare import compare
-from ..constants import app_configuration
 from ..pipeline_spec import PipelineSpecs
-from ..shared import read_json_file, log_file_name_from_prefix
+from ..shared import log_file_name_from_prefix, log_folder_exists, read_json_file
 
 
 def compare_command(pipeline_specs: PipelineSpecs, args):
-    log_folder = app_configuration["log_folder"]
-    if not os.path.exists(log_folder):
-        print(f"No log folder '{log_folder}'.")
-        return
+    # Deferred so that other subcommands don't pay for importing rich.
+    from ..compare import compare
 
-    prefix_a = args.prefix_a
-    results_a = read_json_file(log_file_name_from_prefix(prefix_a))
+    if not log_folder_exists():
+        return
 
-    prefix_b = args.prefix_b
-    results_b = read_json_file(log_file_name_from_prefix(prefix_b))
+    filename_a = log_file_name_from_prefix(args.prefix_a)
+    filename_b = log_file_name_from_prefix(args.prefix_b)
+    results_a, results_b = read_json_files(filename_a, filename_b)
 
     compare(pipeline_specs, results_a, results_b)
 
+
+def read_json_files(filename_a, filename_b):
+    if filename_a == filename_b:
+        results = read_json_file(filename_a)
+        return results, results
+
+    # Read B on a worker thread so that its file I/O overlaps reading and
+    # parsing A on this thread. A process pool would parse both logs in
+    # parallel, but the parsed results must then be unpickled here, which
+    # costs about as much as parsing them with orjson.
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        future_b = executor.submit(read_json_file, filename_b)
+        results_a = read_json_file(filename_a)
+        return results_a, future_b.result()
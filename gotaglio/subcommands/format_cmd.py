@@ -1,24 +1,14 @@
-import os
-
-from ..constants import app_configuration
-from ..format import format
 from ..pipeline_spec import PipelineSpecs
-from ..shared import log_file_name_from_prefix, read_data_file, read_json_file
+from ..shared import read_log_file_and_spec
 
 
 def format_command(pipeline_specs: PipelineSpecs, args):
-    log_folder = app_configuration["log_folder"]
-    if not os.path.exists(log_folder):
-        print(f"No log folder '{log_folder}'.")
-        return
-
-    prefix = args.prefix
-    case_uuid_prefix = args.case_id_prefix
-    results = read_data_file(log_file_name_from_prefix(prefix), False, False)
-
-    pipeline_name = results["metadata"]["pipeline"]["name"]
-    spec = pipeline_specs.get(pipeline_name)
-    
-    format(spec, results, case_uuid_prefix)
+    # Deferred so that other subcommands don't pay for importing rich.
+    from ..format import format
 
+    loaded = read_log_file_and_spec(pipeline_specs, args.prefix)
+    if loaded is None:
+        return
+    results, spec = loaded
 
+    format(spec, results, args.case_id_prefix)
@@ -1,3 +1,4 @@
+import sys
 import time
 
 from ..constants import app_configuration
@@ -5,6 +6,9 @@ from ..shared import get_files_sorted_by_creation
 
 def show_history():
   records = get_files_sorted_by_creation(app_configuration["log_folder"])
-  for r in records:
-      local_time = time.strftime('%Y-%m-%d %H:%M:%S', time.localtime(r[1]))
-      print(f"{r[0]}: {local_time}")
+  lines = [
+      f"{name}: {time.strftime('%Y-%m-%d %H:%M:%S', time.localtime(created))}\n"
+      for name, created in records
+  ]
+  # Write the whole listing at once, rather than one print() per run.
+  sys.stdout.write("".join(lines))
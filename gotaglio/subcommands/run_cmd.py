@@ -1,5 +1,4 @@
 import asyncio
-from rich.progress import Progress, SpinnerColumn, TimeElapsedColumn
 from typing import Any, cast
 
 from ..constants import app_configuration
@@ -10,12 +9,14 @@ from ..shared import (
     parse_key_value_args,
     read_data_file,
     read_json_file,
+    rerun_inputs,
     write_log_file,
 )
-from ..summarize import summarize
 
 
 def run_command(pipeline_specs: PipelineSpecs, args):
+    from ..summarize import summarize
+
     cases_file = args.cases
     pipeline_name = args.pipeline
     flat_config_patch = parse_key_value_args(args.key_values)
@@ -44,24 +45,27 @@ def run_command(pipeline_specs: PipelineSpecs, args):
 
 
 def rerun_command(pipeline_specs: PipelineSpecs, args):
+    from ..summarize import summarize
+
     original_id = args.id
     log_file_name = log_file_name_from_prefix(original_id)
     log = read_json_file(log_file_name, False)
-    metadata = log["metadata"]
+    based_on = log["uuid"]
+    pipeline, cases = rerun_inputs(log)
+
+    # Only the cases and pipeline metadata are needed from here on. Release
+    # the stage outputs of the original run before starting the new one.
+    del log
 
     # TODO: remove this cast once the args are typed.
     concurrency = cast(
         int, args.concurrency or app_configuration["default_concurrancy"]
     )
 
-    cases = [record["case"] for record in log["results"]]
-    if "pipeline" not in metadata:
-        raise Exception("No pipeline metadata found in results file")
-
-    pipeline_name = metadata["pipeline"]["name"]
+    pipeline_name = pipeline["name"]
     pipeline_spec = pipeline_specs.get(pipeline_name)
 
-    replacement_config = metadata["pipeline"]["config"]
+    replacement_config = pipeline["config"]
     flat_config_patch = parse_key_value_args(args.key_values)
 
     # TODO: remove this cast after we validate or annotate the command-line arguments.
@@ -73,7 +77,7 @@ def rerun_command(pipeline_specs: PipelineSpecs, args):
     )
 
     print(f"Rerun configuration")
-    print(f"  based on: {log["uuid"]}")
+    print(f"  based on: {based_on}")
     print(f"  cases: {log_file_name}")
     print(f"  pipeline: {pipeline_name}")
     diff = director.diff_configs()
@@ -85,10 +89,14 @@ def rerun_command(pipeline_specs: PipelineSpecs, args):
     runlog = run_with_progress_bar(director, cases)
 
     write_log_file(runlog, chatty=True)
-    summarize(pipeline_spec, runlog["results"])
+    summarize(pipeline_spec, runlog)
 
 
 def run_with_progress_bar(director: Director, cases):
+    # Imported here so that subcommands that don't run pipelines don't pay
+    # for it.
+    from rich.progress import Progress, SpinnerColumn, TimeElapsedColumn
+
     with Progress(
         SpinnerColumn(),
         *Progress.get_default_columns(),
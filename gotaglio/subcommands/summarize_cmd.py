@@ -1,25 +1,14 @@
-import os
-
-from ..constants import app_configuration
-from ..make_console import MakeConsole
 from ..pipeline_spec import PipelineSpecs
-from ..shared import log_file_name_from_prefix, read_data_file, read_json_file
-from ..summarize import summarize
+from ..shared import read_log_file_and_spec
 
 
 def summarize_command(pipeline_spec: PipelineSpecs, args):
-    log_folder = app_configuration["log_folder"]
-    if not os.path.exists(log_folder):
-        print(f"No log folder '{log_folder}'.")
-        return
+    # Deferred so that other subcommands don't pay for importing rich.
+    from ..summarize import summarize
 
-    prefix = args.prefix
-    results = read_data_file(log_file_name_from_prefix(prefix), False, False)
+    loaded = read_log_file_and_spec(pipeline_spec, args.prefix)
+    if loaded is None:
+        return
+    results, spec = loaded
 
-    pipeline_name = results["metadata"]["pipeline"]["name"]
-    spec = pipeline_spec.get(pipeline_name)
-    
-    console = MakeConsole()
     summarize(spec, results)
-    console.render()
-
@@ -1,3 +1,6 @@
+from functools import lru_cache
+import inspect
+from itertools import islice
 from rich.table import Table
 from rich.text import Text
 from typing import Any
@@ -6,6 +9,14 @@ from .helpers import IdShortener
 from .make_console import MakeConsole
 from .pipeline_spec import column_spec, get_result, PipelineSpec, uses_turns
 
+# Maximum number of rows in each table printed by Summarizer.
+ROWS_PER_TABLE = 200
+
+# Status cells are shared by every row. rich does not modify Text objects
+# when rendering them, so there is no need to allocate one per row.
+_TEXT_COMPLETE = Text("COMPLETE", style="bold green")
+_TEXT_ERROR = Text("ERROR", style="bold red")
+
 
 def summarize(
     spec: PipelineSpec,
@@ -26,7 +37,8 @@ def summarize(
 class Summarizer:
     def __init__(self, spec: PipelineSpec):
         self._passed_predicate = spec.passed_predicate
-        self._summarizer_spec = spec.summarizer
+        # Only the id column depends on the runlog.
+        self._columns = [status_column, *spec.summarizer.columns]
 
     # This method is used to summarize the results of each pipeline run.
     # It is invoked by the `run`, `rerun`, and `summarize` sub-commands.
@@ -37,21 +49,15 @@ class Summarizer:
         else:
             # To make the summary more readable, create a short, unique prefix
             # for each case id.
-            short_id = IdShortener([result["case"]["uuid"] for result in results])
+            uuids = [result["case"]["uuid"] for result in results]
+            short_id = IdShortener(uuids)
+            short_ids = {uuid: short_id(uuid) for uuid in uuids}
 
             def id_cell(result, turn_index):
                 return (
-                    f"{short_id(result['case']['uuid'])}.{turn_index:02}"
+                    f"{short_ids[result['case']['uuid']]}.{turn_index:02}"
                     if uses_turns(result)
-                    else short_id(result["case"]["uuid"])
-                )
-
-            def status_cell(result, turn_index):
-                succeeded = get_result(result, turn_index)["succeeded"]
-                return (
-                    Text("COMPLETE", style="bold green")
-                    if succeeded
-                    else Text("ERROR", style="bold red")
+                    else short_ids[result["case"]["uuid"]]
                 )
 
             columns = [
@@ -62,38 +68,69 @@ class Summarizer:
                     style="cyan",
                     no_wrap=True,
                 ),
-                column_spec(name="status", contents=status_cell, style="magenta"),
+                *self._columns,
             ]
-            for column in self._summarizer_spec.columns:
-                columns.append(column)
 
             # Using Table from the rich text library.
             # https://rich.readthedocs.io/en/stable/introduction.html
-            table = Table(title=f"Summary for {runlog['uuid']}")
-            for column in columns:
-                table.add_column(
-                    column.name,
-                    **column.params,
+            def make_table(title=None):
+                table = Table(title=title)
+                for column in columns:
+                    table.add_column(
+                        column.name,
+                        **column.params,
+                    )
+                return table
+
+            # Flatten the results into one row per turn. Cases without turns
+            # are rendered as a single row.
+            def flatten():
+                for result in results:
+                    if uses_turns(result):
+                        for index, turn_result in enumerate(result["turns"]):
+                            yield result, index, turn_result
+                    else:
+                        yield result, 0, result
+
+            # Add one row for each case or turn, tallying the totals to be
+            # presented after the table in the same pass. Long runs are
+            # printed as a sequence of tables, so that only one chunk of rows
+            # is held in memory at a time.
+            passed_fn = self._passed_function()
+            contents = [column.contents for column in columns]
+            total_count = 0
+            complete_count = 0
+            passed_count = 0
+            rows = flatten()
+            while True:
+                chunk = list(islice(rows, ROWS_PER_TABLE))
+                if not chunk and total_count > 0:
+                    break
+                table = make_table(
+                    f"Summary for {runlog['uuid']}" if total_count == 0 else None
                 )
-
-            # Set up some counters for totals to be presented after the table.
-            self.total_count = 0
-            self.complete_count = 0
-            self.passed_count = 0
-            self.failed_count = 0
-            self.error_count = 0
-
-            # Add one row for each case.
-            for result in results:
-                if uses_turns(result):
-                    for index, turn_result in enumerate(result["turns"]):
-                        self.render_one_row(table, columns, result, index, turn_result)
-                else:
-                    # If there are no turns, we just render the result as a single row.
-                    self.render_one_row(table, columns, result, 0, result)
-
-            # Display the table and the totals.
-            console.print(table)
+                add_row = table.add_row
+                for result, index, turn_result in chunk:
+                    passed = passed_fn(result, index)
+                    if turn_result["succeeded"]:
+                        complete_count += 1
+                        if passed:
+                            passed_count += 1
+                    # Comprehensions are inlined in Python 3.12, so unpacking
+                    # a list is faster than unpacking a generator or map().
+                    add_row(*[f(result, index) for f in contents])
+                total_count += len(chunk)
+                console.print(table)
+                if len(chunk) < ROWS_PER_TABLE:
+                    break
+
+            self.total_count = total_count
+            self.complete_count = complete_count
+            self.error_count = total_count - complete_count
+            self.passed_count = passed_count
+            self.failed_count = complete_count - passed_count
+
+            # Display the totals.
             console.print()
             console.print(f"Total: {self.total_count}")
             if self.total_count != 0:
@@ -111,34 +148,48 @@ class Summarizer:
                 )
             console.print()
 
-    def render_one_row(self, table, columns, result, turn_index, turn_result):
-        succeeded = turn_result["succeeded"]
+    def passed(self, result, turn_index):
         try:
-            passed = self._passed_predicate(result, turn_index)
+            return self._passed_predicate(result, turn_index)
         except TypeError:
             # Backward compatibility: some predicates accept only one argument
-            passed = self._passed_predicate(result)
-
-        self.total_count += 1
-        if succeeded:
-            self.complete_count += 1
-            if passed:
-                self.passed_count += 1
-            else:
-                self.failed_count += 1
-        else:
-            self.error_count += 1
+            return self._passed_predicate(result)
+
+    def _passed_function(self):
+        """
+        Returns a function of (result, turn_index) for the passed predicate.
+        Predicates that can only accept one argument are detected once here,
+        rather than by a TypeError on every row.
+        """
+        predicate = self._passed_predicate
+        try:
+            inspect.signature(predicate).bind(None, None)
+        except TypeError:
+            return lambda result, turn_index: predicate(result)
+        except ValueError:
+            # No signature is available, e.g. for some builtins.
+            pass
+        return self.passed
+
+
+def status_cell(result, turn_index):
+    succeeded = get_result(result, turn_index)["succeeded"]
+    return _TEXT_COMPLETE if succeeded else _TEXT_ERROR
 
-        row = [col.contents(result, turn_index) for col in columns]
-        table.add_row(*row)
+
+status_column = column_spec(name="status", contents=status_cell, style="magenta")
 
 
 def keywords_cell(result, turn_index):
-    return (
-        ", ".join(sorted(result["case"]["keywords"]))
-        if "keywords" in result["case"]
-        else ""
-    )
+    keywords = result["case"].get("keywords")
+    return _keywords_text(tuple(keywords)) if keywords else ""
+
+
+@lru_cache(maxsize=1024)
+def _keywords_text(keywords):
+    # Cases in a suite tend to share a small number of keyword sets, and the
+    # same case is rendered once per turn, so cache the sorted text.
+    return ", ".join(sorted(keywords))
 
 
 keywords_column = column_spec(name="keywords", contents=keywords_cell)
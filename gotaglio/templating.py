@@ -1,16 +1,27 @@
+from functools import lru_cache
 import json
 from jinja2 import Environment, Template
 import os
 
+
+def json_helper(items):
+    result = ['\n~~~JSON\n']
+    result.append(json.dumps(items, indent=2, ensure_ascii=False))
+    result.append('\n~~~\n')
+    return ''.join(result)
+
+
+# One Environment is shared by every template. Templates are compiled from
+# strings, so the Environment holds no per-template state.
+env = Environment()
+env.filters['json'] = json_helper
+
+
+# Compiling a template generates and compiles Python code, so each distinct
+# source is compiled once per process. The returned function holds no state
+# between calls, so it can be shared by every pipeline that uses the template.
+@lru_cache(maxsize=32)
 def jinja2_template(source):
-    def json_helper(items):
-        result = ['\n~~~JSON\n']
-        result.append(json.dumps(items, indent=2, ensure_ascii=False))
-        result.append('\n~~~\n')
-        return ''.join(result)
-
-    env = Environment()
-    env.filters['json'] = json_helper
     template = env.from_string(source)
 
     async def apply(case):
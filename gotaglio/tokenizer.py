@@ -1,3 +1,5 @@
+import os
+
 from .lazy_imports import tiktoken
 
 
@@ -12,6 +14,8 @@ class Tokenizer:
     -------
     encode(text: str) -> list[int]
       Encodes the input text into a list of token IDs.
+    encode_batch(texts: list[str]) -> list[list[int]]
+      Encodes each of the input texts, in parallel.
 
     """
     def __init__(self):
@@ -20,9 +24,19 @@ class Tokenizer:
     def encode(self, text: str) -> list[int]:
         # Lazily load the tokenizer here so that we don't slow down
         # other scenarios that don't need it.
+        return self._load().encode(text)
+
+    def encode_batch(self, texts: list[str]) -> list[list[int]]:
+        # tiktoken releases the GIL, so the texts are encoded on a pool of
+        # threads.
+        return self._load().encode_batch(texts, num_threads=os.cpu_count() or 1)
+
+    def _load(self):
         if self._tokenizer is None:
             self._tokenizer = tiktoken.get_encoding("cl100k_base")
-        return self._tokenizer.encode(text)
+            # Subsequent calls to encode() go straight to tiktoken.
+            self.encode = self._tokenizer.encode
+        return self._tokenizer
 
 
 tokenizer = Tokenizer()
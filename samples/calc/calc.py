@@ -175,7 +175,7 @@ def cost_cell(result, turn_index):
     Provides contents and formatting for the cost cell for the summary table.
     The cost is the difference between the model's response and the expected answer.
     """
-    cost = glom(result, f"stages.assess", default=None)
+    cost = result.get("stages", {}).get("assess")
     cost_text = "" if cost == None else f"{cost:.2f}"
     return (
         Text(cost_text, style="bold green")
@@ -213,7 +213,7 @@ def passed_predicate(result):
 
     Used by the `format` and `summarize` sub-commands.
     """
-    return glom(result, "stages.assess", default=None) == 0
+    return result.get("stages", {}).get("assess") == 0
 
 
 ###############################################################################
@@ -1,5 +1,4 @@
 from glom import glom
-import json
 import os
 from rich.console import Console
 from rich.text import Text
@@ -26,7 +25,7 @@ from gotaglio.pipeline_spec import (
 )
 from gotaglio.pipeline import Internal, Prompt
 from gotaglio.repair import Repair
-from gotaglio.shared import build_template, to_json_string
+from gotaglio.shared import build_template, json_loads, to_json_string
 from gotaglio.summarize import keywords_column
 from gotaglio.tokenizer import tokenizer
 
@@ -223,7 +222,7 @@ def stages(name, config, registry):
             if text.startswith(marker):
                 text = text[len(marker) :]
             text = text.strip("```")
-            return json.loads(text)
+            return json_loads(text)
 
     # Stage 4: Compare the model response to the expected answer.
     async def assess(context):
@@ -264,7 +263,7 @@ def cost_cell(result: dict[str, Any], turn_index: int):
     Provides contents and formatting for the cost cell for the summary table.
     The cost is the difference between the model's response and the expected answer.
     """
-    cost = glom(get_stages(result, turn_index), "assess.cost", default=None)
+    cost = assess_cost(result, turn_index)
     cost_text = "" if cost == None else f"{cost:.2f}"
     return (
         Text(cost_text, style="bold green")
@@ -293,13 +292,15 @@ def format_turn(console: Console, turn_index, result: dict[str, Any]):
     if passed:
         console.print(f"### Turn {turn_index + 1}: **PASSED**  ")
     else:
-        cost = glom(stages, "stages.assess.cost", default=None)
+        cost = assess_cost(result, turn_index)
         console.print(f"### Turn {turn_index + 1}: **FAILED:** (cost={cost})  ")
     console.print()
 
     input_tokens = sum(
-        len(tokenizer.encode(message["content"]))
-        for message in stages["stages"]["prepare"]
+        len(tokens)
+        for tokens in tokenizer.encode_batch(
+            [message["content"] for message in stages["stages"]["prepare"]]
+        )
     )
     console.print(
         f"Input tokens: {input_tokens}, output tokens: {len(tokenizer.encode(stages['stages']['infer']))}  \n"
@@ -347,7 +348,16 @@ def passed_predicate(result, turn_index=None):
 
     Used by the `format` and `summarize` sub-commands.
     """
-    return glom(get_stages(result, turn_index), "assess.cost", default=None) == 0
+    return assess_cost(result, turn_index) == 0
+
+
+def assess_cost(result, turn_index=None):
+    """
+    Returns the repair cost computed by the assessment stage, or None if
+    the stage did not run.
+    """
+    assess = get_stages(result, turn_index).get("assess")
+    return None if assess is None else assess.get("cost")
 
 
 ###############################################################################
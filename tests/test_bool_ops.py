@@ -1,5 +1,5 @@
 import pytest
-from gotaglio.bool_ops import evaluate_boolean_expression
+from gotaglio.bool_ops import compile_boolean_expression, evaluate_boolean_expression
 
 
 class TestEvaluateBooleanExpression:
@@ -122,6 +122,13 @@ class TestEvaluateBooleanExpression:
         with pytest.raises(KeyError):
             evaluate_boolean_expression("A && C", variables)
 
+        # Variables are required even when the result is decided without them.
+        with pytest.raises(KeyError):
+            evaluate_boolean_expression("A || C", variables)
+
+        with pytest.raises(KeyError):
+            evaluate_boolean_expression("B && C", variables)
+
     def test_empty_variables(self):
         """Test behavior with empty variables dictionary."""
         variables = {}
@@ -195,3 +202,69 @@ class TestEvaluateBooleanExpression:
         assert evaluate_boolean_expression("  ( A   ||   B )   &&   C  ", variables) is True
         assert evaluate_boolean_expression("A && ( B ||   C)", variables) is True
         assert evaluate_boolean_expression("  !  A  ||  B  ", variables) is False
+
+    def test_operator_chains(self):
+        """Test chains of three or more operands."""
+        variables = {"A": True, "B": True, "C": False}
+
+        assert evaluate_boolean_expression("A && B && C", variables) is False
+        assert evaluate_boolean_expression("C || C || A", variables) is True
+        assert evaluate_boolean_expression("A && B && !C", variables) is True
+
+    def test_compiled_expression_is_reused(self):
+        """Test that an expression is parsed once and evaluated per dict."""
+        compiled = compile_boolean_expression("A && !B")
+
+        assert compile_boolean_expression("A && !B") is compiled
+        assert compiled({"A": True, "B": False}) is True
+        assert compiled({"A": True, "B": True}) is False
+
+    def test_reordering_preserves_results(self):
+        """Test that evaluating cheaper operands first does not change results."""
+        # X and Y are missing. The result would be decided by A alone, but
+        # every variable must still be present.
+        with pytest.raises(KeyError):
+            evaluate_boolean_expression("(X || Y) && A", {"A": False})
+
+        with pytest.raises(KeyError):
+            evaluate_boolean_expression("!(X && Y) || A", {"A": True})
+
+        # && and || return a bool, whichever operand decided the result.
+        A, B, C, D = 0, "", 1, 2
+        variables = {"A": A, "B": B, "C": C, "D": D}
+        cases = [
+            ("(A || C) && B", (A or C) and B),
+            ("(C && D) || A", (C and D) or A),
+            ("(C && D) && A", C and D and A),
+            ("(A || B) || C", A or B or C),
+            ("(A || B) || A", A or B or A),
+            ("(C || D) && D", (C or D) and D),
+            ("(A || C) && (B || D) && C", (A or C) and (B or D) and C),
+        ]
+        for expression, expected in cases:
+            result = evaluate_boolean_expression(expression, variables)
+            assert result is bool(expected), expression
+
+    def test_reordering_saves_lookups(self):
+        """Test that operands are looked up at most once, cheapest first."""
+
+        class CountingDict(dict):
+            lookups = 0
+
+            def __getitem__(self, key):
+                CountingDict.lookups += 1
+                return super().__getitem__(key)
+
+        def lookups(expression, **variables):
+            CountingDict.lookups = 0
+            evaluate_boolean_expression(expression, CountingDict(variables))
+            return CountingDict.lookups
+
+        # Operands of equal cost are evaluated in source order.
+        assert lookups("A || B || C || E", A=False, B=False, C=False, E=True) == 4
+        assert lookups("B || C", B=False, C=True) == 2
+        assert lookups("A && B && C", A=True, B=True, C=False) == 3
+
+        # A plain variable is evaluated before a subexpression.
+        assert lookups("(B || C) && A", A=False, B=False, C=True) == 1
+        assert lookups("(B && C) || A", A=True, B=True, C=True) == 1
@@ -0,0 +1,62 @@
+from gotaglio.compare import compare
+from gotaglio.pipeline_spec import PipelineSpec, PipelineSpecs
+
+
+def create_specs():
+    spec = PipelineSpec(
+        name="test",
+        description="Test pipeline",
+        configuration={},
+        create_dag=lambda name, config, registry: None,
+        passed_predicate=lambda result: result["stages"]["answer"] == "yes",
+    )
+    return PipelineSpecs([spec])
+
+
+def create_runlog(run_uuid, answers, pipeline_name="test"):
+    return {
+        "uuid": run_uuid,
+        "metadata": {"pipeline": {"name": pipeline_name}},
+        "results": [
+            {
+                "case": {"uuid": uuid},
+                "succeeded": answer is not None,
+                "stages": {"answer": answer},
+            }
+            for uuid, answer in answers.items()
+        ],
+    }
+
+
+def test_compare(capsys):
+    a = create_runlog(
+        "run-a",
+        {
+            "aaaaaaaa-0000-4000-8000-000000000000": "yes",
+            "bbbbbbbb-0000-4000-8000-000000000000": "no",
+        },
+    )
+    b = create_runlog(
+        "run-b",
+        {
+            "aaaaaaaa-0000-4000-8000-000000000000": "yes",
+            "bbbbbbbb-0000-4000-8000-000000000000": "yes",
+            "cccccccc-0000-4000-8000-000000000000": None,
+        },
+    )
+    compare(create_specs(), a, b)
+    text = capsys.readouterr().out
+
+    assert "0 cases only in A" in text
+    assert "1 case only in B" in text
+    assert "2 cases in both A and B" in text
+    assert "1/2 (50%)" in text
+    assert "2/2 (100%)" in text
+
+
+def test_compare_different_pipelines(capsys):
+    a = create_runlog("run-a", {})
+    b = create_runlog("run-b", {}, pipeline_name="other")
+    compare(create_specs(), a, b)
+
+    assert "pipeline names are different" in capsys.readouterr().out
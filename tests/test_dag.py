@@ -16,7 +16,9 @@ def test_valid_build():
     ]
 
     # Should not raise an exception
-    Dag.from_spec(spec)
+    dag = Dag.from_spec(spec)
+    assert dag.roots == ["A"]
+    assert dag.dependent_inputs == {"B": ["A"], "C": ["A"], "D": ["B", "C"]}
 
 
 def test_duplicate_name():
@@ -0,0 +1,54 @@
+import asyncio
+
+from gotaglio.dag import Dag
+from gotaglio.exceptions import ExceptionContext
+from gotaglio.pipeline import process_one_case
+
+
+def test_context_is_kept_on_exception():
+    ExceptionContext.clear_context()
+    with ExceptionContext("outer"):
+        with ExceptionContext("inner"):
+            pass
+        assert ExceptionContext.get_context() == "outer"
+
+    try:
+        with ExceptionContext("outer"):
+            with ExceptionContext("inner"):
+                raise ValueError("bad")
+    except ValueError as e:
+        message = ExceptionContext.format_message(e)
+
+    assert message == "Context: outer > inner\nError: bad\n"
+    ExceptionContext.clear_context()
+    assert ExceptionContext.get_context() == ""
+
+
+def test_context_is_per_task():
+    async def case(name, entered, other_entered):
+        with ExceptionContext(name):
+            entered.set()
+            await other_entered.wait()
+            return ExceptionContext.get_context()
+
+    async def main():
+        a, b = asyncio.Event(), asyncio.Event()
+        return await asyncio.gather(case("a", a, b), case("b", b, a))
+
+    assert asyncio.run(main()) == ["a", "b"]
+
+
+def test_stage_context_is_reported_by_process_one_case():
+    async def extract(context):
+        with ExceptionContext("Extracting JSON"):
+            raise ValueError("bad")
+
+    dag = Dag.from_linear({"extract": extract})
+
+    result = asyncio.run(process_one_case({"uuid": "a"}, dag))
+    assert result["exception"]["message"] == "Context: Extracting JSON\nError: bad\n"
+
+    case = {"uuid": "b", "turns": [{"user": "hi"}]}
+    result = asyncio.run(process_one_case(case, dag))
+    turn = result["turns"][0]
+    assert turn["exception"]["message"] == "Context: Extracting JSON\nError: bad\n"
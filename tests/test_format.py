@@ -0,0 +1,52 @@
+from gotaglio.format import format
+from gotaglio.pipeline_spec import FormatterSpec, PipelineSpec
+
+
+def create_spec():
+    return PipelineSpec(
+        name="test",
+        description="Test pipeline",
+        configuration={},
+        create_dag=lambda name, config, registry: None,
+        passed_predicate=lambda result: result["stages"]["answer"] == "yes",
+        formatter=FormatterSpec(
+            format_turn=lambda console, index, result: console.print(
+                f"answer: {result['stages']['answer']}"
+            )
+        ),
+    )
+
+
+def create_runlog():
+    def result(uuid, answer, keywords=None):
+        case = {"uuid": uuid}
+        if keywords is not None:
+            case["keywords"] = keywords
+        return {"case": case, "succeeded": True, "stages": {"answer": answer}}
+
+    return {
+        "uuid": "run",
+        "metadata": {"pipeline": {"name": "test", "config": {}}},
+        "results": [
+            result("aaaaaaaa-0000-4000-8000-000000000000", "yes", ["k1", "k2"]),
+            result("abbbbbbb-0000-4000-8000-000000000000", "no"),
+        ],
+    }
+
+
+def test_format(capsys):
+    format(create_spec(), create_runlog())
+    text = capsys.readouterr().out
+
+    assert "## Case: aaa - PASSED" in text
+    assert "**Keywords:** k1, k2" in text
+    assert "## Case: abb - FAILED" in text
+    assert "answer: no" in text
+
+
+def test_format_case_prefix(capsys):
+    format(create_spec(), create_runlog(), "ab")
+    text = capsys.readouterr().out
+
+    assert "## Case: aaa" not in text
+    assert "## Case: abb - FAILED" in text
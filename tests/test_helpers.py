@@ -0,0 +1,24 @@
+import pytest
+
+from gotaglio.helpers import IdShortener
+
+
+def test_id_shortener():
+    ids = [
+        "aaaaaaaa-0000-4000-8000-000000000000",
+        "aaaabbbb-0000-4000-8000-000000000000.2",
+        "bbbbbbbb-0000-4000-8000-000000000000",
+    ]
+    short_id = IdShortener(ids)
+
+    assert [short_id(id) for id in ids] == ["aaaaa", "aaaab.2", "bbbbb"]
+    # Ids that were not passed to IdShortener are shortened on demand.
+    assert short_id("cccccccc-0000-4000-8000-000000000000.1") == "ccccc.1"
+    assert short_id("not-a-uuid") is None
+
+
+def test_id_shortener_rejects_duplicates():
+    with pytest.raises(ValueError):
+        IdShortener(["aaaaaaaa-0000-4000-8000-000000000000"] * 2)
+    with pytest.raises(ValueError):
+        IdShortener(["not-a-uuid"])
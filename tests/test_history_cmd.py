@@ -0,0 +1,14 @@
+from gotaglio import shared
+from gotaglio.subcommands.history_cmd import show_history
+
+
+def test_show_history(tmp_path, monkeypatch, capsys):
+    monkeypatch.setitem(shared.app_configuration._config, "log_folder", str(tmp_path))
+    show_history()
+    assert capsys.readouterr().out == ""
+
+    for name in ["abc.json", "def.json"]:
+        (tmp_path / name).write_text("{}")
+    show_history()
+    lines = capsys.readouterr().out.splitlines()
+    assert sorted(line.split(":")[0] for line in lines) == ["abc", "def"]
@@ -0,0 +1,37 @@
+import pytest
+
+from gotaglio.main import main, subparser_builders
+
+
+def run_main(monkeypatch, *args):
+    monkeypatch.setattr("sys.argv", ["gotag", *args])
+    main([])
+
+
+def test_help_lists_every_subcommand(monkeypatch, capsys):
+    run_main(monkeypatch, "help")
+    out = capsys.readouterr().out
+    for name in subparser_builders:
+        assert name in out
+
+
+def test_help_for_subcommand(monkeypatch, capsys):
+    run_main(monkeypatch, "help", "run")
+    assert "The name of the pipeline to run" in capsys.readouterr().out
+
+
+def test_single_subcommand(monkeypatch, capsys):
+    run_main(monkeypatch, "pipelines")
+    assert "Top level exception" not in capsys.readouterr().out
+
+    with pytest.raises(SystemExit):
+        run_main(monkeypatch, "run")
+    assert "the following arguments are required" in capsys.readouterr().err
+
+
+def test_unknown_subcommand(monkeypatch, capsys):
+    with pytest.raises(SystemExit):
+        run_main(monkeypatch, "unknown")
+    err = capsys.readouterr().err
+    assert "invalid choice" in err
+    assert "summarize" in err
@@ -79,7 +79,7 @@ async def test_azure_openai5_uses_max_completion_tokens_and_omits_temperature_to
     recorded = {"create_calls": []}
 
     class FakeCompletions:
-        def create(self, **kwargs):
+        async def create(self, **kwargs):
             recorded["create_calls"].append(kwargs)
 
             @dataclass
@@ -109,7 +109,7 @@ async def test_azure_openai5_uses_max_completion_tokens_and_omits_temperature_to
     # Monkeypatch the openai client used in gotaglio.models
     from gotaglio import models as models_module
 
-    monkeypatch.setattr(models_module, "openai", type("_FakeOpenAIModule", (), {"AzureOpenAI": FakeAzureOpenAI}))
+    monkeypatch.setattr(models_module, "openai", type("_FakeOpenAIModule", (), {"AsyncAzureOpenAI": FakeAzureOpenAI}))
 
     # Build AzureOpenAI5 with a fake registry
     class FakeRegistry:
@@ -159,4 +159,118 @@ async def test_azure_openai5_uses_max_completion_tokens_and_omits_temperature_to
     )
     assert len(recorded["create_calls"]) == 1
     kwargs = recorded["create_calls"][0]
-    assert kwargs.get("max_completion_tokens") == 77
\ No newline at end of file
+    assert kwargs.get("max_completion_tokens") == 77
+
+@pytest.mark.asyncio
+async def test_azure_ai_runs_blocking_client_off_the_event_loop(monkeypatch):
+    import threading
+
+    from gotaglio import models as models_module
+    from gotaglio.models import AzureAI
+
+    threads = []
+
+    class FakeChatCompletionsClient:
+        def __init__(self, **kwargs):
+            pass
+
+        def complete(self, messages):
+            threads.append(threading.current_thread())
+
+            @dataclass
+            class Message:
+                content: str
+
+            @dataclass
+            class Choice:
+                message: Message
+
+            @dataclass
+            class Response:
+                choices: list
+
+            return Response(choices=[Choice(message=Message(content="ok"))])
+
+    monkeypatch.setattr(
+        models_module,
+        "azure_ai_inference",
+        type("_FakeInference", (), {"ChatCompletionsClient": FakeChatCompletionsClient}),
+    )
+    monkeypatch.setattr(
+        models_module,
+        "azure_core_credentials",
+        type("_FakeCredentials", (), {"AzureKeyCredential": lambda key: key}),
+    )
+
+    class FakeRegistry:
+        def register_model(self, name, model):
+            pass
+
+    model = AzureAI(
+        FakeRegistry(),
+        {"name": "ai", "endpoint": "https://example", "key": "xyz"},
+    )
+    assert await model.infer([{"role": "user", "content": "hi"}]) == "ok"
+    assert threads and threads[0] is not threading.main_thread()
+
+
+def test_register_models_reads_config_files_once(tmp_path, monkeypatch):
+    from gotaglio import models as models_module
+    from gotaglio.constants import app_configuration
+    from gotaglio.shared import write_data_file
+
+    write_data_file(
+        tmp_path / "models.json",
+        [{"name": "ai", "type": "AZURE_AI", "endpoint": "https://example"}],
+    )
+    write_data_file(tmp_path / "credentials.json", {"ai": "secret"})
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setitem(app_configuration._config, "model_config_files", ["models.json"])
+    monkeypatch.setitem(
+        app_configuration._config, "model_credentials_files", ["credentials.json"]
+    )
+
+    reads = []
+    read_data_file = models_module.read_data_file
+
+    def counting_read_data_file(filename, *args):
+        reads.append(filename)
+        return read_data_file(filename, *args)
+
+    monkeypatch.setattr(models_module, "read_data_file", counting_read_data_file)
+    models_module.read_data_file_cached.cache_clear()
+
+    class FakeRegistry:
+        def __init__(self):
+            self.models = {}
+
+        def register_model(self, name, model):
+            self.models[name] = model
+
+    first = FakeRegistry()
+    second = FakeRegistry()
+    models_module.register_models(first)
+    models_module.register_models(second)
+
+    assert len(reads) == 2
+    assert first.models["ai"]._config["key"] == "secret"
+    assert second.models["ai"]._config is not first.models["ai"]._config
+    assert "key" not in models_module.read_first_data_file(["models.json"])[0]
+
+
+def test_register_models_rejects_unknown_type(tmp_path, monkeypatch):
+    from gotaglio import models as models_module
+    from gotaglio.constants import app_configuration
+    from gotaglio.shared import write_data_file
+
+    write_data_file(tmp_path / "models.json", [{"name": "x", "type": "UNKNOWN"}])
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setitem(app_configuration._config, "model_config_files", ["models.json"])
+    monkeypatch.setitem(app_configuration._config, "model_credentials_files", [])
+
+    class FakeRegistry:
+        def register_model(self, name, model):
+            pass
+
+    with pytest.raises(ValueError, match="unsupported model type: UNKNOWN"):
+        models_module.register_models(FakeRegistry())
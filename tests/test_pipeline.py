@@ -4,10 +4,12 @@ import pytest
 
 from gotaglio.dag import Dag
 from gotaglio.gotag import Gotaglio
+from gotaglio.pipeline import ensure_required_configs, Prompt
 from gotaglio.pipeline_spec import (
     get_result,
     PipelineSpec,
 )
+from gotaglio.shared import apply_patch
 
 
 def create_dag(name, config, registry):
@@ -123,3 +125,75 @@ def test_multi_turn_pipeline():
         cases, "0.turns.0.answer"
     )
     assert passed_predicate(glom(runlog, "results.0")) == True
+
+
+def test_rerun():
+    """
+    Verifies that a run can be rerun from its runlog with a modified configuration.
+    """
+    spec = PipelineSpec(
+        name="single_turn",
+        description="A single turn pipeline with three stages",
+        configuration={
+            "stage1": {"initial": 1000},
+        },
+        create_dag=create_dag,
+    )
+    cases = [{"uuid": "9507b491-1e58-49f6-86af-47f4e97ae1aa", "user": "hello"}]
+
+    gt = Gotaglio([spec])
+    runlog = gt.run("single_turn", cases, {"stage1.initial": 2000})
+    rerun = gt.rerun(runlog, {"stage1.initial": 3000})
+
+    assert glom(runlog, "results.0.stages.stage3.result3") == 2111
+    assert glom(rerun, "results.0.stages.stage3.result3") == 3111
+    assert glom(rerun, "results.0.case") == cases[0]
+
+    with pytest.raises(Exception, match="No pipeline metadata"):
+        gt.rerun({"metadata": {}, "results": []})
+
+
+def test_run_limits_concurrency_and_keeps_case_order():
+    in_flight = 0
+    max_in_flight = 0
+
+    def create_dag(name, config, registry):
+        async def stage(context):
+            nonlocal in_flight, max_in_flight
+            in_flight += 1
+            max_in_flight = max(max_in_flight, in_flight)
+            # Later cases finish first.
+            await asyncio.sleep(0.001 * (10 - context["case"]["value"]))
+            in_flight -= 1
+            return context["case"]["value"]
+
+        return Dag.from_linear({"stage": stage})
+
+    spec = PipelineSpec(
+        name="concurrent",
+        description="A pipeline that records how many cases run at once",
+        configuration={},
+        create_dag=create_dag,
+        passed_predicate=lambda result: True,
+    )
+    cases = [
+        {"uuid": f"{i:08}-0000-4000-8000-000000000000", "value": i}
+        for i in range(10)
+    ]
+
+    runlog = Gotaglio([spec]).run("concurrent", cases, concurrency=3)
+
+    assert max_in_flight == 3
+    assert [result["stages"]["stage"] for result in runlog["results"]] == list(range(10))
+
+
+def test_ensure_required_configs():
+    default_config = {
+        "infer": {"model": {"name": Prompt("Model name")}},
+        "extract": {"mode": "json"},
+    }
+    config = apply_patch(default_config, {"infer.model.name": "x"})
+    ensure_required_configs("p", default_config, config)
+
+    with pytest.raises(ValueError, match=r"missing 'infer\.model\.name'"):
+        ensure_required_configs("p", default_config, default_config)
@@ -0,0 +1,25 @@
+import pytest
+
+from gotaglio.pipeline_spec import PipelineSpec, PipelineSpecs
+
+
+def create_spec(name, description="A pipeline"):
+    return PipelineSpec(
+        name=name,
+        description=description,
+        configuration={},
+        create_dag=lambda name, config, registry: None,
+    )
+
+
+def test_pipeline_specs_get():
+    specs = PipelineSpecs(
+        [create_spec("a"), create_spec("b"), create_spec("a", "Duplicate")]
+    )
+
+    assert specs.get("b").name == "b"
+    assert specs.get("a").description == "A pipeline"
+    assert [spec.name for spec in specs] == ["a", "b", "a"]
+    assert len(specs) == 3
+    with pytest.raises(ValueError, match="Cannot find pipeline 'c'"):
+        specs.get("c")
@@ -0,0 +1,267 @@
+import pytest
+
+from gotaglio.repair import EditType, Repair
+
+
+def create_repair():
+    return Repair("id", "options", [], ["name"], "name")
+
+
+def item(name, quantity=1, options=None):
+    result = {"name": name, "quantity": quantity}
+    if options is not None:
+        result["options"] = options
+    return result
+
+
+def test_add_ids():
+    """
+    Ids are hierarchical and unique across calls to addIds().
+    """
+    repair = create_repair()
+    tree = [item("latte", options=[item("oat milk"), item("vanilla")])]
+    observed = repair.addIds(tree)
+    expected = repair.addIds(tree)
+
+    assert observed[0]["id"] == "0"
+    assert observed[0]["options"][0]["id"] == "0.0"
+    assert observed[0]["options"][1]["id"] == "0.1"
+    assert expected[0]["id"] == "1"
+
+    # The original tree is not modified.
+    assert "id" not in tree[0]
+
+
+def test_add_ids_in_place():
+    repair = create_repair()
+    tree = [item("latte", options=[item("oat milk")])]
+    result = repair.addIds(tree, in_place=True)
+
+    assert result is tree
+    assert tree[0]["id"] == "0"
+    assert tree[0]["options"][0]["id"] == "0.0"
+
+
+def test_add_ids_rejects_existing_id():
+    repair = create_repair()
+    with pytest.raises(RuntimeError):
+        repair.addIds({"id": "x", "name": "latte"})
+
+
+def test_identical_trees_have_no_cost():
+    repair = create_repair()
+    tree = [item("latte", options=[item("oat milk")]), item("muffin", 2)]
+    result = repair.diff(repair.addIds(tree), repair.addIds(tree))
+
+    assert result["op"] == EditType.REPAIR
+    assert result["cost"] == 0
+    assert result["steps"] == []
+
+
+def test_empty_trees():
+    repair = create_repair()
+    result = repair.diff([], [])
+    assert result["cost"] == 0
+    assert result["steps"] == []
+
+
+def test_change_attribute():
+    repair = create_repair()
+    observed = repair.addIds([item("latte", 1)])
+    expected = repair.addIds([item("latte", 2)])
+    result = repair.diff(observed, expected)
+
+    assert result["cost"] == 1
+    assert result["steps"] == ["0: latte: change quantity to `2`"]
+
+
+def test_set_and_remove_attributes():
+    repair = create_repair()
+    observed = repair.addIds([{"name": "latte", "size": "tall"}])
+    expected = repair.addIds([{"name": "latte", "quantity": 2}])
+    result = repair.diff(observed, expected)
+
+    assert result["cost"] == 2
+    assert result["steps"] == [
+        "0: latte: set quantity to `2`",
+        "0: latte: remove size",
+    ]
+
+
+def test_insert_and_delete():
+    repair = create_repair()
+    observed = repair.addIds([item("latte"), item("scone")])
+    expected = repair.addIds([item("latte"), item("muffin", options=[item("jam")])])
+    result = repair.diff(observed, expected)
+
+    # Replacing the scone with the muffin is an atomic mismatch on `name`, so
+    # the repair deletes the scone and inserts the muffin with its option.
+    assert result["cost"] == pytest.approx(1 + 2 + 2 - 0.001)
+    assert result["steps"] == [
+        "1: scone: delete item",
+        "3: muffin: insert default version",
+        "3: muffin: change attribute(quantity) to '1'",
+        "3.0: jam: insert default version",
+        "3.0: jam: change attribute(quantity) to '1'",
+    ]
+
+
+def test_extra_observed_item_is_deleted():
+    repair = create_repair()
+    observed = repair.addIds([item("latte"), item("scone")])
+    expected = repair.addIds([item("latte")])
+    result = repair.diff(observed, expected)
+
+    assert result["cost"] == 1
+    assert result["steps"] == ["1: scone: delete item"]
+
+
+def test_missing_item_is_inserted():
+    repair = create_repair()
+    observed = repair.addIds([item("latte")])
+    expected = repair.addIds([item("latte"), item("scone", 3)])
+    result = repair.diff(observed, expected)
+
+    assert result["cost"] == 2
+    assert result["steps"] == [
+        "2: scone: insert default version",
+        "2: scone: change attribute(quantity) to '3'",
+    ]
+
+
+def test_repair_children():
+    repair = create_repair()
+    observed = repair.addIds([item("latte", options=[item("oat milk")])])
+    expected = repair.addIds([item("latte", options=[item("oat milk", 2)])])
+    result = repair.diff(observed, expected)
+
+    assert result["cost"] == 1
+    assert result["steps"] == ["0.0: oat milk: change quantity to `2`"]
+
+
+def test_unordered_matching():
+    """
+    Children are matched irrespective of order.
+    """
+    repair = create_repair()
+    observed = repair.addIds([item("latte"), item("scone"), item("muffin")])
+    expected = repair.addIds([item("muffin"), item("latte"), item("scone", 2)])
+    result = repair.diff(observed, expected)
+
+    assert result["cost"] == 1
+    assert result["steps"] == ["1: scone: change quantity to `2`"]
+
+
+def test_linear_sum_assignment_falls_back_to_scipy(monkeypatch):
+    """
+    The optional `lap` solver and the scipy fallback agree on the assignment.
+    """
+    import numpy as np
+    from gotaglio import repair as repair_module
+
+    costs = np.array([[4.0, 1.0, 3.0], [2.0, 0.0, 5.0], [3.0, 2.0, 2.0]])
+    expected = [(0, 1), (1, 0), (2, 2)]
+
+    def assignments():
+        return [(int(r), int(c)) for r, c in repair_module.linear_sum_assignment(costs)]
+
+    assert assignments() == expected
+
+    monkeypatch.setattr(repair_module, "_lapjv", lambda: None)
+    assert assignments() == expected
+
+
+def test_diff_caches_are_cleared():
+    """
+    Memoized edits do not outlive a call to diff().
+    """
+    repair = create_repair()
+    observed = repair.addIds([item("latte"), item("scone")])
+    expected = repair.addIds([item("latte", 2), item("muffin")])
+    first = repair.diff(observed, expected)
+
+    assert repair._repairCache == {}
+    assert repair._insertCache == {}
+    assert repair._deleteCache == {}
+    assert repair.diff(observed, expected) == first
+
+
+def test_diff_ignores_stale_cache_entries():
+    """
+    Edits memoized outside of diff() are not reused by diff().
+    """
+    repair = create_repair()
+    observed = repair.addIds([item("latte")])
+    expected = repair.addIds([item("latte", 2)])
+
+    # Poison the insert cache with an entry for the expected item.
+    repair._insertCostCache[id(expected[0])] = 100
+
+    result = repair.diff(observed, expected)
+    assert result["cost"] == 1
+
+
+def test_add_ids_nested():
+    repair = create_repair()
+    root = item("root", options=[item("a"), item("b", options=[item("c")])])
+    node = root
+    for _ in range(50):
+        child = item("child")
+        node["options"][0]["options"] = [child]
+        node = child
+        node["options"] = [item("leaf")]
+
+    result = repair.addIds(root)
+    assert result["options"][1]["id"] == "0.1"
+    assert result["options"][1]["options"][0]["id"] == "0.1.0"
+    node = result
+    depth = 0
+    while "options" in node:
+        node = node["options"][0]
+        depth += 1
+    assert node["id"] == "0" + ".0" * depth
+
+
+def test_atomic_mismatch():
+    """
+    A node whose atomic attributes differ, including one present on only
+    one side, is deleted and reinserted rather than repaired.
+    """
+    repair = create_repair()
+    replaced = ["0: a: delete item", "0: b: insert default version"]
+    cases = [
+        ({"name": "a"}, {"name": "a"}, []),
+        ({"size": 1}, {"size": 2}, ["0: ???: change size to `2`"]),
+        ({"name": "a"}, {"name": "b"}, replaced),
+        ({"name": "a"}, {}, ["0: a: delete item", "0: ???: insert default version"]),
+        ({}, {"name": "b"}, ["0: ???: delete item", "0: b: insert default version"]),
+    ]
+    for observed, expected, steps in cases:
+        repair.resetIds()
+        observed = repair.addIds(observed)
+        repair.resetIds()
+        expected = repair.addIds(expected)
+        assert repair.diff(observed, expected)["steps"] == steps
+
+
+def test_steps_formatted_only_for_assigned_cells(monkeypatch):
+    """
+    Filling the cost matrix does not format repair steps.
+    """
+    repair = create_repair()
+    observed = repair.addIds([item(f"item{i}", options=[item("a")]) for i in range(8)])
+    expected = repair.addIds(
+        [item(f"item{i}", 2, options=[item("b")]) for i in reversed(range(8))]
+    )
+
+    calls = []
+    formatStep = repair._formatStep
+
+    def countingFormatStep(item, message):
+        calls.append(message)
+        return formatStep(item, message)
+
+    monkeypatch.setattr(repair, "_formatStep", countingFormatStep)
+    result = repair.diff(observed, expected)
+
+    assert len(calls) == len(result["steps"])
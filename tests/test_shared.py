@@ -0,0 +1,262 @@
+import argparse
+import asyncio
+import json
+import pytest
+import uuid
+
+from gotaglio import shared
+from gotaglio.pipeline import Prompt
+from gotaglio.shared import (
+    apply_patch,
+    clone_json,
+    get_filenames_with_prefix,
+    get_files_sorted_by_creation,
+    minimal_unique_prefix,
+)
+
+
+def test_apply_patch_does_not_modify_target():
+    target = {"prepare": {"template": "a.txt"}, "infer": {"model": {"name": "x"}}}
+    result = apply_patch(target, {"infer.model.name": "y", "extract.mode": "z"})
+
+    assert result == {
+        "prepare": {"template": "a.txt"},
+        "infer": {"model": {"name": "y"}},
+        "extract": {"mode": "z"},
+    }
+    assert target["infer"]["model"]["name"] == "x"
+    assert "extract" not in target
+
+
+def test_apply_patch_rejects_dict_overwrite():
+    target = {"infer": {"model": {"name": "x"}}}
+    with pytest.raises(ValueError, match="infer.model.name"):
+        apply_patch(target, {"infer.model": "y"})
+
+
+def test_apply_patch_indexes_lists():
+    target = {"a": [1, {"b": 2}], "c": [[0, 1]]}
+    result = apply_patch(target, {"a.1.b": 5, "a.0": 3, "c.0.-1": 4})
+
+    assert result == {"a": [3, {"b": 5}], "c": [[0, 4]]}
+    assert target == {"a": [1, {"b": 2}], "c": [[0, 1]]}
+
+    with pytest.raises(ValueError, match="would overwrite a dict"):
+        apply_patch(target, {"a.1": 0})
+    with pytest.raises(ValueError, match="not a valid list index"):
+        apply_patch(target, {"a.2": 0})
+    with pytest.raises(ValueError, match="not a valid list index"):
+        apply_patch(target, {"a.x.b": 0})
+
+
+def test_parse_key_value_args():
+    assert shared.parse_key_value_args(["a=1", "b.c=x=y", "d="]) == {
+        "a": "1",
+        "b.c": "x=y",
+        "d": "",
+    }
+    with pytest.raises(argparse.ArgumentTypeError):
+        shared.parse_key_value_args(["a"])
+
+
+def test_clone_json():
+    prompt = Prompt("A prompt")
+    value = {"a": [1, {"b": "c"}], "d": None, "e": 1.5, "f": True, "g": prompt}
+    result = clone_json(value)
+
+    assert result["a"] == value["a"]
+    assert result["a"] is not value["a"]
+    assert result["a"][1] is not value["a"][1]
+    assert isinstance(result["g"], Prompt)
+    assert result["g"] is not prompt
+    assert result["g"]._description == "A prompt"
+
+
+def test_minimal_unique_prefix():
+    assert minimal_unique_prefix([]) == 0
+    assert minimal_unique_prefix(["abcd"]) == 1
+    assert minimal_unique_prefix(["abcd", "bcde"]) == 1
+    assert minimal_unique_prefix(["abcd", "abce", "bcde"]) == 4
+    assert minimal_unique_prefix(["abcd", "xbcd", "abxx"]) == 3
+    # Duplicates are ignored.
+    assert minimal_unique_prefix(["abcd", "abcd", "axyz"]) == 2
+
+
+def test_log_folder_listings(tmp_path):
+    for name in ["b.json", "a.json", "ab.json"]:
+        (tmp_path / name).write_text("{}")
+    (tmp_path / "a-folder").mkdir()
+
+    files = get_files_sorted_by_creation(tmp_path)
+    assert sorted(name for name, _ in files) == ["a", "ab", "b"]
+    assert [t for _, t in files] == sorted(t for _, t in files)
+
+    assert sorted(get_filenames_with_prefix(tmp_path, "a")) == ["a.json", "ab.json"]
+    assert get_filenames_with_prefix(tmp_path, "x") == []
+
+
+def test_log_file_name_from_prefix(tmp_path, monkeypatch):
+    monkeypatch.setitem(shared.app_configuration._config, "log_folder", str(tmp_path))
+    assert shared.get_newest_file(tmp_path) is None
+    with pytest.raises(ValueError):
+        shared.log_file_name_from_prefix("latest")
+
+    for name in ["abc.json", "abd.json", "xyz.json"]:
+        (tmp_path / name).write_text("{}")
+    (tmp_path / "zzz-folder").mkdir()
+
+    newest = get_files_sorted_by_creation(tmp_path)[-1][0]
+    assert shared.get_newest_file(tmp_path) == newest
+    assert shared.log_file_name_from_prefix("latest") == str(tmp_path / f"{newest}.json")
+    assert shared.log_file_name_from_prefix("x") == str(tmp_path / "xyz.json")
+    with pytest.raises(ValueError, match="Multiple runs"):
+        shared.log_file_name_from_prefix("ab")
+    with pytest.raises(ValueError, match="No runs"):
+        shared.log_file_name_from_prefix("q")
+
+
+@pytest.mark.parametrize("use_orjson", [True, False])
+def test_json_round_trip(tmp_path, monkeypatch, use_orjson):
+    if not use_orjson:
+        monkeypatch.setattr(shared, "orjson", None)
+    data = {
+        "uuid": "abc",
+        "text": "café ✓",
+        "values": [1, 2.5, None, True],
+        "nested": {},
+    }
+    filename = tmp_path / "data.json"
+
+    shared.write_json_file(filename, data)
+    assert shared.read_json_file(filename) == data
+    assert "café ✓" in filename.read_text(encoding="utf-8")
+    assert shared.to_json_string(data) == json.dumps(data, indent=2, ensure_ascii=False)
+    assert shared.read_json_file(tmp_path / "missing.json", optional=True) == {}
+
+
+def test_read_data_file_reports_invalid_json(tmp_path):
+    filename = tmp_path / "cases.json"
+    filename.write_text("[{")
+    with pytest.raises(ValueError, match="Error parsing .json file"):
+        shared.read_data_file(filename)
+
+
+@pytest.mark.parametrize("use_orjson", [True, False])
+def test_json_loads_shares_keys(monkeypatch, use_orjson):
+    if not use_orjson:
+        monkeypatch.setattr(shared, "orjson", None)
+    text = json.dumps([{"case": {"uuid": str(i)}, "succeeded": True} for i in range(3)])
+    results = shared.json_loads(text.encode("utf-8"))
+
+    keys = [next(iter(result)) for result in results]
+    assert keys[0] == "case"
+    assert all(key is keys[0] for key in keys)
+
+
+@pytest.mark.parametrize(
+    "use_orjson, expected",
+    [
+        (True, b"[\n  null,\n  null,\n  1e-7,\n  0.1\n]"),
+        (False, b"[\n  NaN,\n  Infinity,\n  1e-07,\n  0.1\n]"),
+    ],
+)
+def test_json_dumps_output_differences(monkeypatch, use_orjson, expected):
+    # The orjson and standard library writers differ for non-finite floats
+    # and exponent formatting. Log files reflect whichever one is installed.
+    if use_orjson:
+        pytest.importorskip("orjson")
+    else:
+        monkeypatch.setattr(shared, "orjson", None)
+    assert shared.json_dumps([float("nan"), float("inf"), 1e-7, 0.1]) == expected
+
+    # A document orjson cannot serialize is written by the standard library.
+    assert shared.json_dumps([2**70, float("nan")]) == b"[\n  1180591620717411303424,\n  NaN\n]"
+
+
+@pytest.mark.parametrize("suffix", [".json", ".yaml", ".yml"])
+def test_data_file_round_trip(tmp_path, suffix):
+    data = [{"uuid": "abc", "text": "café ✓", "turns": [{"user": "hi"}]}]
+    filename = tmp_path / f"cases{suffix}"
+
+    shared.write_data_file(filename, data)
+    assert shared.read_data_file(filename) == data
+
+
+def test_write_data_file_rejects_unknown_suffix(tmp_path):
+    with pytest.raises(ValueError):
+        shared.write_data_file(tmp_path / "cases.txt", [])
+    assert not (tmp_path / "cases.txt").exists()
+
+
+def test_uuid4_strings():
+    ids = shared.uuid4_strings(100)
+    assert len(set(ids)) == 100
+    for id in ids:
+        parsed = uuid.UUID(id)
+        assert parsed.version == 4
+        assert parsed.variant == uuid.RFC_4122
+        assert str(parsed) == id
+    assert shared.uuid4_strings(0) == []
+
+
+def test_get_and_set_path():
+    target = {"a": {"b": 1}, "c": "text"}
+    assert shared.get_path(target, ["a", "b"]) == 1
+    assert shared.get_path(target, ["a", "x"]) is None
+    assert shared.get_path(target, ["c", "d"], default=0) == 0
+    assert shared.get_path({"a": [{"b": 1}]}, ["a", "0", "b"]) == 1
+    assert shared.get_path({"a": [{"b": 1}]}, ["a", "1", "b"]) is None
+
+    shared.set_path(target, ["a", "b"], 2)
+    shared.set_path(target, ["x", "y", "z"], 3)
+    assert target == {"a": {"b": 2}, "c": "text", "x": {"y": {"z": 3}}}
+
+    with pytest.raises(ValueError):
+        shared.set_path(target, ["c", "d"], 4)
+
+
+def test_build_template(tmp_path):
+    template_file = tmp_path / "template.txt"
+    template_file.write_text("Hello {{ name }}")
+    config = {"prepare": {"template": str(template_file)}}
+
+    template = shared.build_template(config, "prepare.template", "prepare.template_text")
+    assert config["prepare"]["template_text"] == "Hello {{ name }}"
+    assert asyncio.run(template({"name": "world"})) == "Hello world"
+
+    # Inline template text takes precedence over the template file.
+    config = {"prepare": {"template": "missing.txt", "text": "Hi {{ name }}"}}
+    template = shared.build_template(config, "prepare.template", "prepare.text")
+    assert asyncio.run(template({"name": "there"})) == "Hi there"
+
+
+def test_read_log_file_and_spec(tmp_path, monkeypatch, capsys):
+    class Specs:
+        def get(self, name):
+            return f"spec for {name}"
+
+    monkeypatch.setitem(shared.app_configuration._config, "log_folder", str(tmp_path / "missing"))
+    assert shared.read_log_file_and_spec(Specs(), "latest") is None
+    assert "No log folder" in capsys.readouterr().out
+
+    runlog = {"uuid": "abc", "metadata": {"pipeline": {"name": "p"}}, "results": []}
+    shared.write_json_file(tmp_path / "abc.json", runlog)
+    monkeypatch.setitem(shared.app_configuration._config, "log_folder", str(tmp_path))
+    assert shared.read_log_file_and_spec(Specs(), "latest") == (runlog, "spec for p")
+
+
+def test_build_template_reuses_compiled_template():
+    config = {"prepare": {"text": "Hi {{ name }}"}}
+    first = shared.build_template(config, "prepare.template", "prepare.text")
+    second = shared.build_template(config, "prepare.template", "prepare.text")
+    assert first is second
+
+
+def test_write_log_file_creates_log_folder(tmp_path, monkeypatch):
+    log_folder = tmp_path / "logs"
+    monkeypatch.setitem(shared.app_configuration._config, "log_folder", str(log_folder))
+    runlog = {"uuid": "abc", "results": []}
+
+    shared.write_log_file(runlog)
+    shared.write_log_file(runlog)
+    assert shared.read_json_file(log_folder / "abc.json") == runlog
@@ -0,0 +1,144 @@
+from rich.console import Console
+
+from gotaglio.pipeline_spec import (
+    column_spec,
+    get_result,
+    PipelineSpec,
+    SummarizerSpec,
+)
+from gotaglio import summarize as summarize_module
+from gotaglio.summarize import keywords_cell, keywords_column, Summarizer
+
+
+def create_spec():
+    def passed_predicate(result, turn_index=None):
+        return get_result(result, turn_index)["stages"]["answer"] == "yes"
+
+    def answer_cell(result, turn_index):
+        return get_result(result, turn_index)["stages"]["answer"]
+
+    return PipelineSpec(
+        name="test",
+        description="Test pipeline",
+        configuration={},
+        create_dag=lambda name, config, registry: None,
+        passed_predicate=passed_predicate,
+        summarizer=SummarizerSpec(
+            columns=[column_spec(name="answer", contents=answer_cell), keywords_column]
+        ),
+    )
+
+
+def create_runlog():
+    return {
+        "uuid": "run",
+        "results": [
+            {
+                "case": {"uuid": "aaaaaaaa-0000-4000-8000-000000000000", "keywords": ["b", "a"]},
+                "succeeded": True,
+                "stages": {"answer": "yes"},
+            },
+            {
+                "case": {"uuid": "abbbbbbb-0000-4000-8000-000000000000", "turns": [{}, {}, {}]},
+                "turns": [
+                    {"succeeded": True, "stages": {"answer": "yes"}},
+                    {"succeeded": True, "stages": {"answer": "no"}},
+                    {"succeeded": False, "stages": {"answer": "yes"}},
+                ],
+            },
+        ],
+    }
+
+
+def test_summarizer():
+    console = Console(record=True, width=120)
+    summarizer = Summarizer(create_spec())
+    summarizer.summarize(console, create_runlog())
+
+    assert summarizer.total_count == 4
+    assert summarizer.complete_count == 3
+    assert summarizer.error_count == 1
+    assert summarizer.passed_count == 2
+    assert summarizer.failed_count == 1
+
+    text = console.export_text()
+    for line in ["Total: 4", "Complete: 3/4 (75.00%)", "Passed: 2/4 (50.00%)"]:
+        assert line in text
+    assert "abb.01" in text
+    assert "a, b" in text
+    assert text.count("COMPLETE") == 3
+    assert text.count("ERROR") == 1
+
+
+def test_summarizer_no_results():
+    console = Console(record=True)
+    Summarizer(create_spec()).summarize(console, {"uuid": "run", "results": []})
+    assert "No results." in console.export_text()
+
+
+def test_summarizer_prints_long_runs_in_chunks(monkeypatch):
+    monkeypatch.setattr(summarize_module, "ROWS_PER_TABLE", 3)
+    console = Console(record=True, width=120)
+    summarizer = Summarizer(create_spec())
+    summarizer.summarize(console, create_runlog())
+
+    text = console.export_text()
+    assert text.count("Summary for run") == 1
+    assert text.count("answer") == 2
+    assert summarizer.total_count == 4
+
+    # A run that fills the last table exactly does not print an empty table.
+    monkeypatch.setattr(summarize_module, "ROWS_PER_TABLE", 2)
+    console = Console(record=True, width=120)
+    summarizer.summarize(console, create_runlog())
+    assert console.export_text().count("answer") == 2
+    assert summarizer.passed_count == 2
+
+
+def test_summarizer_passed_predicates():
+    def one_arg(result):
+        return result["stages"]["answer"] == "yes"
+
+    def two_args(result, turn_index):
+        return get_result(result, turn_index)["stages"]["answer"] == "yes"
+
+    results = []
+    for predicate in [one_arg, two_args, create_spec().passed_predicate]:
+        spec = create_spec()
+        spec.passed_predicate = predicate
+        summarizer = Summarizer(spec)
+        runlog = create_runlog()
+        runlog["results"] = runlog["results"][:1]
+        summarizer.summarize(Console(record=True), runlog)
+        results.append(summarizer.passed_count)
+
+    assert results == [1, 1, 1]
+
+
+def test_summarizer_shortens_each_id_once(monkeypatch):
+    calls = []
+    id_shortener = summarize_module.IdShortener
+
+    def counting_id_shortener(uuids):
+        short_id = id_shortener(uuids)
+
+        def counting_short_id(uuid):
+            calls.append(uuid)
+            return short_id(uuid)
+
+        return counting_short_id
+
+    monkeypatch.setattr(summarize_module, "IdShortener", counting_id_shortener)
+    Summarizer(create_spec()).summarize(Console(record=True), create_runlog())
+
+    # One call per case, although the second case has three turns.
+    assert len(calls) == 2
+
+
+def test_keywords_cell():
+    result = {"case": {"uuid": "x", "keywords": ["b", "c", "a"]}}
+    assert keywords_cell(result, 0) == "a, b, c"
+    assert keywords_cell(result, 1) == "a, b, c"
+    assert result == {"case": {"uuid": "x", "keywords": ["b", "c", "a"]}}
+    assert keywords_cell({"case": {"uuid": "x"}}, 0) == ""
+    assert keywords_cell({"case": {"uuid": "x", "keywords": []}}, 0) == ""
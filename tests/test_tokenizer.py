@@ -0,0 +1,42 @@
+from gotaglio import tokenizer as tokenizer_module
+from gotaglio.tokenizer import Tokenizer
+
+
+class FakeEncoding:
+    def encode(self, text):
+        return [ord(c) for c in text]
+
+    def encode_batch(self, texts, num_threads):
+        assert num_threads >= 1
+        return [self.encode(text) for text in texts]
+
+
+class FakeTiktoken:
+    def __init__(self):
+        self.loads = 0
+
+    def get_encoding(self, name):
+        assert name == "cl100k_base"
+        self.loads += 1
+        return FakeEncoding()
+
+
+def test_tokenizer_loads_encoding_once(monkeypatch):
+    fake = FakeTiktoken()
+    monkeypatch.setattr(tokenizer_module, "tiktoken", fake)
+    tokenizer = Tokenizer()
+    assert fake.loads == 0
+
+    assert tokenizer.encode("ab") == [97, 98]
+    assert tokenizer.encode("c") == [99]
+    assert fake.loads == 1
+
+
+def test_tokenizer_encode_batch(monkeypatch):
+    fake = FakeTiktoken()
+    monkeypatch.setattr(tokenizer_module, "tiktoken", fake)
+    tokenizer = Tokenizer()
+
+    assert tokenizer.encode_batch(["ab", "", "c"]) == [[97, 98], [], [99]]
+    assert tokenizer.encode("d") == [100]
+    assert fake.loads == 1